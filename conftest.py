@@ -0,0 +1,22 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Pytest configuration
+"""
+import sys
+
+collect_ignore = []
+
+if sys.version_info < (3, 5):
+    # asyncio api uses async/await syntax.
+    collect_ignore.extend(['guessit/aio.py', 'guessit/test/test_aio.py'])
+
+
+def pytest_configure(config):
+    """
+    Disable benchmarks by default when pytest-benchmark is installed, so benchmarked functions are only ran once.
+
+    Use --benchmark-enable to run them for real.
+    """
+    if config.pluginmanager.hasplugin('benchmark'):
+        config.option.benchmark_disable = True
@@ -3,6 +3,7 @@
 """
 Extracts as much information as possible from a video file.
 """
-from .api import guessit, GuessItApi
+from .api import guessit, guessit_many, GuessItApi
+from .options import GuessitOptions
 
 from .__version__ import __version__
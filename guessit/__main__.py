@@ -6,6 +6,12 @@ Entry point module
 # pragma: no cover
 from __future__ import print_function
 
+try:
+    from collections import OrderedDict
+except ImportError:  # pragma: no-cover
+    from ordereddict import OrderedDict  # pylint:disable=import-error
+
+import io
 import json
 import logging
 import os
@@ -15,21 +21,116 @@ import six
 from guessit import api
 from guessit.__version__ import __version__
 from guessit.jsonutils import GuessitEncoder
-from guessit.options import argument_parser
+from guessit.options import argument_parser, GuessitOptions
 from rebulk.__version__ import __version__ as __rebulk_version__
 
 
-def guess_filename(filename, options):
+def read_filenames(input_file, skip_comments=False):
     """
-    Guess a single filename using given options
+    Read filenames from an input file line by line, skipping blank lines.
     """
-    if not options.yaml and not options.json and not options.show_property:
-        print('For:', filename)
+    for line in input_file:
+        line = line.strip()
+        if not line:
+            continue
+        if skip_comments and line.startswith('#'):
+            continue
+        yield line
+
+
+def read_stdin(skip_comments=False):
+    """
+    Read filenames from standard input, decoded as utf-8 like input files, whatever the locale encoding is.
+    """
+    if six.PY2 or not hasattr(sys.stdin, 'buffer'):
+        for filename in read_filenames(sys.stdin, skip_comments):
+            yield filename
+        return
+    input_file = io.TextIOWrapper(sys.stdin.buffer, encoding='utf-8')
+    try:
+        for filename in read_filenames(input_file, skip_comments):
+            yield filename
+    finally:
+        input_file.detach()  # Keep sys.stdin open.
+
+
+def iter_filenames(options):
+    """
+    Iterate over filenames given in command line arguments and input file, lazily
+    """
+    for filename in options.filename:
+        if filename:
+            yield filename
+    if options.input_file:
+        if options.input_file == '-':
+            for filename in read_stdin(options.skip_comments):
+                yield filename
+            return
+        if six.PY2:
+            input_file = open(options.input_file, 'r')
+        else:
+            input_file = open(options.input_file, 'r', encoding='utf-8')
+        try:
+            for filename in read_filenames(input_file, options.skip_comments):
+                yield filename
+        finally:
+            input_file.close()
+
+
+def guess_filenames(filenames, options):
+    """
+    Guess filenames using given options, lazily
+    """
+    cmd_options = vars(options)
+    cmd_options['implicit'] = True  # Force implicit option in CLI
+    cmd_options = GuessitOptions(cmd_options)  # Parsed once for all filenames
+
+    for filename in filenames:
+        yield filename, api.guessit(filename, cmd_options)
+
+
+def guess_filenames_parallel(filenames, options):
+    """
+    Guess filenames using given options, with a pool of worker processes
+    """
+    from guessit import parallel
 
     cmd_options = vars(options)
     cmd_options['implicit'] = True  # Force implicit option in CLI
 
-    guess = api.guessit(filename, vars(options))
+    for filename, guess in parallel.guessit_many(filenames, cmd_options, processes=options.jobs or None):
+        if isinstance(guess, api.GuessitException):
+            raise guess
+        yield filename, guess
+
+
+def display_guesses_jsonl(guesses, flush=False):
+    """
+    Display guesses as json lines, writing one compact object per guess
+    :return: True if at least one guess was displayed
+    :rtype: bool
+    """
+    encoder = GuessitEncoder(ensure_ascii=False, separators=(',', ':'))
+    write = sys.stdout.write
+    displayed = False
+    for filename, guess in guesses:
+        displayed = True
+        line = OrderedDict()
+        line['input'] = filename
+        line.update(guess)
+        write(encoder.encode(line))
+        write('\n')
+        if flush:
+            sys.stdout.flush()
+    return displayed
+
+
+def display_guess(filename, guess, options):
+    """
+    Display the guess of a filename using given options
+    """
+    if not options.yaml and not options.json and not options.show_property:
+        print('For:', filename)
 
     if options.show_property:
         print(guess.get(options.show_property, ''))
@@ -87,7 +188,7 @@ def display_properties(options):
                     print(4 * ' ' + '[!] %s' % (property_value,))
 
 
-def main(args=None):  # pylint:disable=too-many-branches
+def main(args=None):  # pylint:disable=too-many-branches,too-many-statements
     """
     Main function for entry point
     """
@@ -130,26 +231,28 @@ def main(args=None):  # pylint:disable=too-many-branches
         display_properties(options)
         help_required = False
 
-    filenames = []
-    if options.filename:
-        for filename in options.filename:
-            filenames.append(filename)
-    if options.input_file:
-        if six.PY2:
-            input_file = open(options.input_file, 'r')
-        else:
-            input_file = open(options.input_file, 'r', encoding='utf-8')
-        try:
-            filenames.extend([line.strip() for line in input_file.readlines()])
-        finally:
-            input_file.close()
+    if options.show_property and not options.jsonl:
+        if not options.only_properties:
+            options.only_properties = [options.show_property]
+        elif options.show_property not in options.only_properties:
+            options.only_properties.append(options.show_property)
 
-    filenames = list(filter(lambda f: f, filenames))
+    filenames = iter_filenames(options)
+    if options.jobs is not None:
+        guesses = guess_filenames_parallel(filenames, options)
+    else:
+        guesses = guess_filenames(filenames, options)
 
-    if filenames:
-        for filename in filenames:
+    stream = options.input_file == '-'
+    if options.jsonl:
+        if display_guesses_jsonl(guesses, stream):
+            help_required = False
+    else:
+        for filename, guess in guesses:
             help_required = False
-            guess_filename(filename, options)
+            display_guess(filename, guess, options)
+            if stream:
+                sys.stdout.flush()
 
     if help_required:  # pragma: no cover
         argument_parser.print_help()
@@ -0,0 +1,219 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Asyncio API, guessing names in an executor so the event loop is never blocked by parsing.
+
+It requires python 3.5 or later.
+"""
+import asyncio
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+import weakref
+
+from . import api
+from .api import GuessItApi, GuessitException, _copy_result
+from .parallel import _guess_chunk, _restore_chunk
+
+DEFAULT_MAX_IN_FLIGHT = 64
+
+
+def _guess_strings(guessit_api, strings, options):
+    """
+    Guess strings in an executor thread.
+    :param guessit_api:
+    :type guessit_api: GuessItApi
+    :param strings:
+    :type strings: list[str]
+    :param options: options prepared by GuessItApi
+    :type options: GuessitOptions
+    :return: (string, result) tuples
+    :rtype: list[tuple]
+    """
+    ret = []
+    for string in strings:
+        try:
+            result = guessit_api._guess(string, options)  # pylint:disable=protected-access
+        except:  # pylint:disable=bare-except
+            result = GuessitException(string, options)
+        ret.append((string, result))
+    return ret
+
+
+def _cached_results(guessit_api, strings, options):
+    """
+    Retrieves cached results of strings, and their cache keys.
+    :param guessit_api:
+    :type guessit_api: GuessItApi
+    :param strings:
+    :type strings: list[str]
+    :param options: options prepared by GuessItApi
+    :type options: GuessitOptions
+    :return: results, None for strings that are not cached, and cache keys, None if results can't be cached.
+    :rtype: tuple[list]
+    """
+    results = [None] * len(strings)
+    cache_keys = [None] * len(strings)
+    if guessit_api.cache is not None:
+        for i, string in enumerate(strings):
+            cache_keys[i] = GuessItApi._cache_key(string, options)  # pylint:disable=protected-access
+            if cache_keys[i] is not None:
+                cached = guessit_api.cache.get(cache_keys[i])
+                if cached is not None:
+                    results[i] = _copy_result(cached)
+    return results, cache_keys
+
+
+class AsyncGuessItApi(object):
+    """
+    An asyncio API, guessing names in a thread or process executor.
+
+    At most max_in_flight jobs are submitted to the executor at any time for each event loop, others are waiting
+    in the event loop. Each guessit_many call keeps at most two jobs per max_in_flight pending. Cached results are
+    retrieved without using the executor.
+
+    With a ProcessPoolExecutor, workers guess names with the default rebulk object, and result matches are detached
+    from patterns used to build them, like with guessit.parallel.
+    """
+
+    def __init__(self, guessit_api=None, executor=None, max_in_flight=DEFAULT_MAX_IN_FLIGHT):
+        """
+        :param guessit_api: the api used to guess names and cache results. If None, the default api is used.
+        :type guessit_api: GuessItApi
+        :param executor: a thread or process executor. If None, the default executor of the event loop is used.
+        :type executor: concurrent.futures.Executor
+        :param max_in_flight: maximum number of jobs submitted to the executor at once.
+        :type max_in_flight: int
+        """
+        self._api = guessit_api
+        self.executor = executor
+        self.max_in_flight = max_in_flight
+        self._semaphores = weakref.WeakKeyDictionary()
+
+    @property
+    def api(self):
+        """
+        The api used to guess names and cache results.
+        :return:
+        :rtype: GuessItApi
+        """
+        return self._api if self._api is not None else api.default_api
+
+    def _semaphore(self):
+        """
+        Semaphore limiting jobs in flight for the running event loop.
+        """
+        loop = asyncio.get_event_loop()
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.max_in_flight)
+            self._semaphores[loop] = semaphore
+        return semaphore
+
+    async def _run(self, strings, options):
+        """
+        Guess strings in the executor, waiting for a free slot if too many jobs are in flight.
+        """
+        loop = asyncio.get_event_loop()
+        async with self._semaphore():
+            if isinstance(self.executor, ProcessPoolExecutor):
+                return _restore_chunk(await loop.run_in_executor(self.executor, _guess_chunk, strings, options))
+            return await loop.run_in_executor(self.executor, _guess_strings, self.api, strings, options)
+
+    async def guessit_many(self, strings, options=None, chunksize=1):
+        """
+        Retrieves all matches from each string of an iterable.
+
+        Options are parsed once for the whole batch. When a guess fails, the GuessitException is returned instead
+        of the result.
+        :param strings: filenames or release names
+        :type strings: iterable[str]
+        :param options:
+        :type options: str|dict|GuessitOptions
+        :param chunksize: number of names guessed by each executor job.
+        :type chunksize: int
+        :return: (string, result) tuples, in input order
+        :rtype: list[tuple]
+        """
+        try:
+            options = GuessItApi._prepare_options(options)  # pylint:disable=protected-access
+        except:
+            raise GuessitException(None, options)
+
+        guessit_api = self.api
+        strings = list(strings)
+        results, cache_keys = _cached_results(guessit_api, strings, options)
+        missing = [i for i, result in enumerate(results) if result is None]
+
+        def store(chunk, chunk_results):
+            """
+            Store results of a chunk, caching them in this process if they were guessed by worker processes.
+            """
+            for i, (_, result) in zip(chunk, chunk_results):
+                if cache_keys[i] is not None and isinstance(self.executor, ProcessPoolExecutor) and \
+                        not isinstance(result, GuessitException):
+                    # Workers have their own cache, so results are cached in this process.
+                    guessit_api.cache.set(cache_keys[i], result)
+                    result = _copy_result(result)
+                results[i] = result
+
+        pending = deque()
+        try:
+            for start in range(0, len(missing), chunksize):
+                chunk = missing[start:start + chunksize]
+                pending.append((chunk, asyncio.ensure_future(self._run([strings[i] for i in chunk], options))))
+                if len(pending) >= 2 * self.max_in_flight:
+                    chunk, future = pending.popleft()
+                    store(chunk, await future)
+            while pending:
+                chunk, future = pending.popleft()
+                store(chunk, await future)
+        finally:
+            for _, future in pending:
+                future.cancel()
+        return list(zip(strings, results))
+
+    async def guessit(self, string, options=None):
+        """
+        Retrieves all matches from string as a dict
+        :param string: the filename or release name
+        :type string: str
+        :param options:
+        :type options: str|dict|GuessitOptions
+        :return:
+        :rtype: MatchesDict
+        """
+        _, result = (await self.guessit_many([string], options))[0]
+        if isinstance(result, GuessitException):
+            raise result
+        return result
+
+
+default_api = AsyncGuessItApi()
+
+
+async def guessit(string, options=None):
+    """
+    Retrieves all matches from string as a dict, using the default asyncio api.
+    :param string: the filename or release name
+    :type string: str
+    :param options:
+    :type options: str|dict|GuessitOptions
+    :return:
+    :rtype: MatchesDict
+    """
+    return await default_api.guessit(string, options)
+
+
+async def guessit_many(strings, options=None, chunksize=1):
+    """
+    Retrieves all matches from each string of an iterable, using the default asyncio api.
+    :param strings: filenames or release names
+    :type strings: iterable[str]
+    :param options:
+    :type options: str|dict|GuessitOptions
+    :param chunksize: number of names guessed by each executor job.
+    :type chunksize: int
+    :return: (string, result) tuples, in input order
+    :rtype: list[tuple]
+    """
+    return await default_api.guessit_many(strings, options, chunksize)
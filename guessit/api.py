@@ -8,14 +8,18 @@ try:
 except ImportError:  # pragma: no-cover
     from ordereddict import OrderedDict  # pylint:disable=import-error
 
+import copy
+import threading
 import traceback
 
 import six
 
 from rebulk.introspector import introspect
+from rebulk.match import Match, MatchesDict
 
-from .rules import rebulk_builder
-from .options import parse_options
+from .cache import LRUCache
+from .options import GuessitOptions
+from .pipeline import Pipeline, supported as pipelines_supported, logging_enabled as pipelines_bypassed
 from .__version__ import __version__
 
 
@@ -40,6 +44,20 @@ class GuessitException(Exception):
         self.string = string
         self.options = options
 
+    def __reduce__(self):
+        return _restore_exception, (self.string, self.options, str(self))
+
+
+def _restore_exception(string, options, message):
+    """
+    Restore a pickled GuessitException, keeping the original exception report.
+    """
+    exception = Exception.__new__(GuessitException)
+    Exception.__init__(exception, message)
+    exception.string = string
+    exception.options = options
+    return exception
+
 
 def guessit(string, options=None):
     """
@@ -47,13 +65,26 @@ def guessit(string, options=None):
     :param string: the filename or release name
     :type string: str
     :param options: the filename or release name
-    :type options: str|dict
+    :type options: str|dict|GuessitOptions
     :return:
     :rtype:
     """
     return default_api.guessit(string, options)
 
 
+def guessit_many(strings, options=None):
+    """
+    Retrieves all matches from each string of an iterable, lazily.
+    :param strings: filenames or release names
+    :type strings: iterable[str]
+    :param options: the filename or release name
+    :type options: str|dict|GuessitOptions
+    :return: (string, result) tuples, in input order. result is a GuessitException if the guess failed.
+    :rtype: iterator[tuple]
+    """
+    return default_api.guessit_many(strings, options)
+
+
 def properties(options=None):
     """
     Retrieves all properties with possible values that can be guessed
@@ -65,29 +96,231 @@ def properties(options=None):
     return default_api.properties(options)
 
 
+def warmup():
+    """
+    Build the default api and perform a first guess, so that next calls don't pay initialization cost.
+
+    This can be called by servers at boot time, as default api is otherwise built on first use.
+    """
+    default_api.warmup()
+
+
+def _copy_match(match):
+    """
+    Shallow copy of a match, with its own tags list.
+    """
+    match_copy = copy.copy(match)
+    match_copy.tags = list(match.tags)
+    return match_copy
+
+
+def _select_properties(result, names):
+    """
+    Remove properties that were not requested from a guess result.
+    :param result:
+    :type result: MatchesDict
+    :param names: requested properties, or None to keep all properties.
+    :type names: list[str]
+    """
+    if not names:
+        return
+    for name in list(result.keys()):
+        if name not in names:
+            del result[name]
+            result.matches.pop(name, None)
+            result.values_list.pop(name, None)
+
+
+def _copy_result(result, copy_match=_copy_match):
+    """
+    Copy a guess result, so that cached results can't be altered by the caller.
+    :param result:
+    :type result: MatchesDict
+    :param copy_match: function used to copy Match objects.
+    :type copy_match: callable
+    :return:
+    :rtype: MatchesDict
+    """
+    copies = {}
+
+    def copy_value(value):
+        """
+        Copy Match objects, keeping them shared between the different structures of the result.
+        """
+        if isinstance(value, Match):
+            if id(value) not in copies:
+                copies[id(value)] = copy_match(value)
+            return copies[id(value)]
+        return value
+
+    ret = MatchesDict()
+    for key, value in result.items():
+        ret[key] = [copy_value(item) for item in value] if isinstance(value, list) else copy_value(value)
+    for name, matches in result.matches.items():
+        ret.matches[name] = [copy_value(match) for match in matches]
+    for name, values in result.values_list.items():
+        ret.values_list[name] = [copy_value(value) for value in values]
+    return ret
+
+
 class GuessItApi(object):
     """
     An api class that can be configured with custom Rebulk configuration.
     """
 
-    def __init__(self, rebulk):
+    def __init__(self, rebulk=None, cache=None, pipelines_maxsize=32):
         """
-        :param rebulk: Rebulk instance to use.
+        :param rebulk: Rebulk instance to use. If None, default Rebulk instance is built on first use.
         :type rebulk: Rebulk
+        :param cache: Cache instance to use for results. If None, results are not cached.
+        :type cache: guessit.cache.LRUCache
+        :param pipelines_maxsize: Number of pipelines specialized for options to keep. If 0, patterns and rules
+        enabled for options are resolved by Rebulk on each guess. Pipelines are only used with a plain Rebulk
+        instance, not a subclass, and when rebulk debug logging is disabled.
+        :type pipelines_maxsize: int
         :return:
         :rtype:
         """
-        self.rebulk = rebulk
+        self._rebulk = rebulk
+        self._rebulk_lock = threading.Lock()
+        self.cache = cache
+        self.pipelines = LRUCache(maxsize=pipelines_maxsize) if pipelines_maxsize else None
+
+    @property
+    def rebulk(self):
+        """
+        Rebulk instance used by this api, built on first access if not given.
+        :return:
+        :rtype: Rebulk
+        """
+        if self._rebulk is None:
+            with self._rebulk_lock:
+                if self._rebulk is None:
+                    from .rules import rebulk_builder
+                    self._rebulk = rebulk_builder()
+        return self._rebulk
+
+    @rebulk.setter
+    def rebulk(self, rebulk):
+        self._rebulk = rebulk
+        if self.pipelines is not None:
+            self.pipelines.clear()
+        if self.cache is not None:
+            self.cache.clear()
+
+    def pipeline(self, options):
+        """
+        Pipeline of patterns and rules enabled for given options, built on first use for each options.
+        :param options: options prepared with _prepare_options
+        :type options: GuessitOptions
+        :return: the pipeline, or None if pipelines are disabled, not supported by rebulk, or options can't be hashed.
+        :rtype: guessit.pipeline.Pipeline
+        """
+        if self.pipelines is None or not pipelines_supported(self.rebulk):
+            return None
+        try:
+            pipeline = self.pipelines.get(options)
+        except TypeError:
+            return None
+        if pipeline is None:
+            pipeline = Pipeline(self.rebulk, options)
+            self.pipelines.set(options, pipeline)
+        return pipeline
+
+    def warmup(self):
+        """
+        Build the Rebulk instance and lookup tables, and perform a first guess, so that next calls don't pay
+        initialization cost.
+        """
+        from .rules import build_tables
+        build_tables(self.rebulk)
+        self.guessit('Show.Name.2016.09.08.FRENCH.720p.HDTV.x264-GROUP.[site.com].mkv')
 
     @staticmethod
-    def _fix_option_encoding(value):
-        if isinstance(value, list):
-            return [GuessItApi._fix_option_encoding(item) for item in value]
-        if six.PY2 and isinstance(value, six.text_type):
-            return value.encode("utf-8")
-        if six.PY3 and isinstance(value, six.binary_type):
-            return value.decode('ascii')
-        return value
+    def _cache_key(string, options):
+        """
+        Builds the cache key for given string and options, or None if options can't be hashed.
+        """
+        try:
+            hash(options)
+        except TypeError:
+            return None
+        return type(string), string, options
+
+    @staticmethod
+    def _prepare_options(options):
+        """
+        Parse options and fix their encoding.
+
+        GuessitOptions are used as is, and options given as string are parsed only once.
+        :param options:
+        :type options: str|dict|GuessitOptions
+        :return:
+        :rtype: GuessitOptions
+        """
+        if isinstance(options, GuessitOptions):
+            return options
+        if isinstance(options, six.string_types):
+            prepared = _string_options.get(options)
+            if prepared is None:
+                prepared = GuessitOptions(options)
+                _string_options.set(options, prepared)
+            return prepared
+        return GuessitOptions(options)
+
+    def _matches(self, string, options):
+        """
+        Retrieves matches from string, using the pipeline for options when available.
+
+        Rebulk.matches is used when rebulk debug logging is enabled, so that guessit -v shows patterns and rules
+        activity.
+        """
+        pipeline = None if pipelines_bypassed() else self.pipeline(options)
+        if pipeline is not None:
+            return pipeline.matches(string, options)
+        return self.rebulk.matches(string, options)
+
+    def _guess(self, string, options):
+        """
+        Retrieves all matches from string as a dict, using already prepared options.
+        :param string: the filename or release name
+        :type string: str
+        :param options: options prepared with _prepare_options
+        :type options: GuessitOptions
+        :return:
+        :rtype: MatchesDict
+        """
+        cache_key = None
+        if self.cache is not None:
+            cache_key = GuessItApi._cache_key(string, options)
+            if cache_key is not None:
+                cached = self.cache.get(cache_key)
+                if cached is not None:
+                    return _copy_result(cached)
+
+        result_decode = False
+        result_encode = False
+        if six.PY2 and isinstance(string, six.text_type):
+            string = string.encode("utf-8")
+            result_decode = True
+        if six.PY3 and isinstance(string, six.binary_type):
+            string = string.decode('ascii')
+            result_encode = True
+        matches = self._matches(string, options)
+        if result_decode:
+            for match in matches:
+                if isinstance(match.value, six.binary_type):
+                    match.value = match.value.decode("utf-8")
+        if result_encode:
+            for match in matches:
+                if isinstance(match.value, six.text_type):
+                    match.value = match.value.encode("ascii")
+        result = matches.to_dict(options.get('advanced', False), options.get('implicit', False))
+        _select_properties(result, options.get('only_properties'))
+        if cache_key is not None:
+            self.cache.set(cache_key, result)
+            return _copy_result(result)
+        return result
 
     def guessit(self, string, options=None):
         """
@@ -95,41 +328,41 @@ class GuessItApi(object):
         :param string: the filename or release name
         :type string: str
         :param options: the filename or release name
-        :type options: str|dict
+        :type options: str|dict|GuessitOptions
         :return:
         :rtype:
         """
         try:
-            options = parse_options(options)
-            result_decode = False
-            result_encode = False
-
-            fixed_options = {}
-            for (key, value) in options.items():
-                key = GuessItApi._fix_option_encoding(key)
-                value = GuessItApi._fix_option_encoding(value)
-                fixed_options[key] = value
-            options = fixed_options
-
-            if six.PY2 and isinstance(string, six.text_type):
-                string = string.encode("utf-8")
-                result_decode = True
-            if six.PY3 and isinstance(string, six.binary_type):
-                string = string.decode('ascii')
-                result_encode = True
-            matches = self.rebulk.matches(string, options)
-            if result_decode:
-                for match in matches:
-                    if isinstance(match.value, six.binary_type):
-                        match.value = match.value.decode("utf-8")
-            if result_encode:
-                for match in matches:
-                    if isinstance(match.value, six.text_type):
-                        match.value = match.value.encode("ascii")
-            return matches.to_dict(options.get('advanced', False), options.get('implicit', False))
+            options = GuessItApi._prepare_options(options)
+            return self._guess(string, options)
         except:
             raise GuessitException(string, options)
 
+    def guessit_many(self, strings, options=None):
+        """
+        Retrieves all matches from each string of an iterable, lazily.
+
+        Options are parsed once for the whole batch. When a guess fails, the GuessitException is yielded instead
+        of the result, and remaining strings are still processed.
+        :param strings: filenames or release names
+        :type strings: iterable[str]
+        :param options: the filename or release name
+        :type options: str|dict|GuessitOptions
+        :return: (string, result) tuples, in input order
+        :rtype: iterator[tuple]
+        """
+        try:
+            options = GuessItApi._prepare_options(options)
+        except:
+            raise GuessitException(None, options)
+
+        for string in strings:
+            try:
+                result = self._guess(string, options)
+            except:  # pylint:disable=bare-except
+                result = GuessitException(string, options)
+            yield string, result
+
     def properties(self, options=None):
         """
         Grab properties and values that can be generated.
@@ -138,6 +371,7 @@ class GuessItApi(object):
         :return:
         :rtype:
         """
+        options = GuessItApi._prepare_options(options)
         unordered = introspect(self.rebulk, options).properties
         ordered = OrderedDict()
         for k in sorted(unordered.keys(), key=six.text_type):
@@ -147,4 +381,6 @@ class GuessItApi(object):
         return ordered
 
 
-default_api = GuessItApi(rebulk_builder())
+_string_options = LRUCache(maxsize=128)
+
+default_api = GuessItApi()
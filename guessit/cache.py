@@ -0,0 +1,166 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Cache utils
+"""
+try:
+    from collections import OrderedDict
+except ImportError:  # pragma: no-cover
+    from ordereddict import OrderedDict  # pylint:disable=import-error
+
+import threading
+import time
+
+
+class LRUCache(object):
+    """
+    A thread-safe cache with a bounded size, evicting least recently used entries first.
+
+    Entries can also be given a time to live, after which they are evicted on next access.
+    """
+
+    def __init__(self, maxsize=1024, ttl=None, timer=time.time):
+        """
+        :param maxsize: maximum number of entries to keep.
+        :type maxsize: int
+        :param ttl: time to live of entries, in seconds. If None, entries never expire.
+        :type ttl: float
+        :param timer: function returning current time, in seconds.
+        :type timer: callable
+        """
+        if maxsize < 1:
+            raise ValueError("maxsize should be greater than 0")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.timer = timer
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        """
+        Retrieves the value stored for given key, and mark it as recently used.
+        :param key:
+        :type key:
+        :param default: value to return if key is missing or expired.
+        :type default:
+        :return:
+        :rtype:
+        """
+        with self._lock:
+            try:
+                expires, value = self._data.pop(key)
+            except KeyError:
+                self.misses += 1
+                return default
+            if expires is not None and expires <= self.timer():
+                self.misses += 1
+                self.evictions += 1
+                return default
+            self._data[key] = (expires, value)
+            self.hits += 1
+            return value
+
+    def set(self, key, value):
+        """
+        Stores a value for given key, evicting least recently used entries if cache is full.
+        :param key:
+        :type key:
+        :param value:
+        :type value:
+        :return:
+        :rtype:
+        """
+        expires = self.timer() + self.ttl if self.ttl is not None else None
+        with self._lock:
+            self._data.pop(key, None)
+            self._data[key] = (expires, value)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        """
+        Removes all entries from the cache.
+        """
+        with self._lock:
+            self._data.clear()
+
+    @property
+    def stats(self):
+        """
+        Retrieves hits, misses, evictions and size counters as a dict.
+        :return:
+        :rtype: dict
+        """
+        return {'hits': self.hits, 'misses': self.misses, 'evictions': self.evictions, 'size': len(self)}
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, key):
+        return key in self._data
+
+
+class InternTable(object):
+    """
+    A bounded table of shared instances, built from their constructor arguments.
+
+    Once the table is full, new values are still built but not interned anymore.
+    """
+
+    def __init__(self, factory, maxsize=1024):
+        """
+        :param factory: function building an instance from given arguments.
+        :type factory: callable
+        :param maxsize: maximum number of instances to keep.
+        :type maxsize: int
+        """
+        self.factory = factory
+        self.maxsize = maxsize
+        self._instances = {}
+
+    def __call__(self, *args):
+        """
+        Retrieves the shared instance for given arguments, building it if required.
+        """
+        try:
+            return self._instances[args]
+        except KeyError:
+            pass
+        instance = self.factory(*args)
+        if len(self._instances) < self.maxsize:
+            instance = self._instances.setdefault(args, instance)
+        return instance
+
+    def clear(self):
+        """
+        Removes all instances from the table.
+        """
+        self._instances.clear()
+
+    def __len__(self):
+        return len(self._instances)
+
+
+def hashable(value):
+    """
+    Converts a value to a canonical hashable form, suitable to be used in a cache key.
+
+    dict are converted to sorted tuple of items, list to tuple and set to frozenset.
+    :param value:
+    :type value:
+    :return:
+    :rtype:
+    :raise TypeError: if value can't be made hashable
+    """
+    if isinstance(value, dict):
+        return tuple(sorted(((hashable(k), hashable(v)) for k, v in value.items()), key=lambda item: repr(item[0])))
+    if isinstance(value, (list, tuple)):
+        return tuple(hashable(item) for item in value)
+    if isinstance(value, (set, frozenset)):
+        return frozenset(hashable(item) for item in value)
+    hash(value)
+    return value
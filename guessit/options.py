@@ -3,11 +3,35 @@
 """
 Options
 """
-from argparse import ArgumentParser
+from argparse import ArgumentParser, ArgumentTypeError, Namespace
 import shlex
 
+try:
+    from collections.abc import Mapping
+except ImportError:  # pragma: no-cover
+    from collections import Mapping
+
 import six
 
+from .cache import hashable
+
+
+def _jobs_count(value):
+    """
+    Parse --jobs argument value, rejecting negative counts
+    :param value:
+    :type value: str
+    :return:
+    :rtype: int
+    """
+    try:
+        jobs = int(value)
+    except ValueError:
+        raise ArgumentTypeError("invalid int value: %r" % value)
+    if jobs < 0:
+        raise ArgumentTypeError("must be 0 or a positive number of processes: %r" % value)
+    return jobs
+
 
 def build_argument_parser():
     """
@@ -42,21 +66,31 @@ def build_argument_parser():
 
     input_opts = opts.add_argument_group("Input")
     input_opts.add_argument('-f', '--input-file', dest='input_file', default=False,
-                            help='Read filenames from an input text file. File should use UTF-8 charset.')
+                            help='Read filenames from an input text file, or from standard input if "-". '
+                                 'File should use UTF-8 charset.')
+    input_opts.add_argument('--skip-comments', dest='skip_comments', action='store_true', default=False,
+                            help='Skip lines starting with "#" in input file.')
+    input_opts.add_argument('--jobs', dest='jobs', type=_jobs_count, default=None,
+                            help='Guess filenames in parallel, using JOBS worker processes. '
+                                 'Use 0 for one process per CPU core.')
 
     output_opts = opts.add_argument_group("Output")
     output_opts.add_argument('-v', '--verbose', action='store_true', dest='verbose', default=False,
                              help='Display debug output')
     output_opts.add_argument('-P', '--show-property', dest='show_property', default=None,
                              help='Display the value of a single property (title, series, video_codec, year, ...)')
+    output_opts.add_argument('--only-property', action='append', dest='only_properties',
+                             help='Guess only this property, skipping patterns and rules that can\'t change it '
+                                  '(can be used multiple times)')
     output_opts.add_argument('-a', '--advanced', dest='advanced', action='store_true', default=False,
                              help='Display advanced information for filename guesses, as json output')
     output_opts.add_argument('-j', '--json', dest='json', action='store_true', default=False,
                              help='Display information for filename guesses as json output')
     output_opts.add_argument('-y', '--yaml', dest='yaml', action='store_true', default=False,
                              help='Display information for filename guesses as yaml output')
-
-
+    output_opts.add_argument('--jsonl', dest='jsonl', action='store_true', default=False,
+                             help='Display information for filename guesses as json lines output, '
+                                  'one compact object per line including the input string')
 
     information_opts = opts.add_argument_group("Information")
     information_opts.add_argument('-p', '--properties', dest='properties', action='store_true', default=False,
@@ -85,4 +119,87 @@ def parse_options(options):
     return options
 
 
+def _normalize_option(value):
+    """
+    Fix encoding of an option value, and convert lists to tuples so it can't be modified.
+    """
+    if isinstance(value, (list, tuple)):
+        return tuple(_normalize_option(item) for item in value)
+    if six.PY2 and isinstance(value, six.text_type):
+        return value.encode("utf-8")
+    if six.PY3 and isinstance(value, six.binary_type):
+        return value.decode('ascii')
+    return value
+
+
+class GuessitOptions(Mapping):
+    """
+    Normalized and frozen options, built once from an option string, a dict or an argparse namespace.
+
+    It's hashable, so it can be used as a cache key, and given again to the api for next guesses without parsing
+    options again. Values can be read as items or as attributes.
+
+    >>> options = GuessitOptions('-t episode -T "The Show"')
+    >>> options['type'], options.expected_title
+    ('episode', ('The Show',))
+    >>> options == GuessitOptions('--type episode --expected-title "The Show"')
+    True
+    >>> GuessitOptions({'type': 'episode', 'expected_title': ['The Show']}) == {'type': 'episode',
+    ...                                                                         'expected_title': ('The Show',)}
+    True
+    """
+
+    def __init__(self, options=None):
+        """
+        :param options:
+        :type options: str|dict|argparse.Namespace|GuessitOptions
+        """
+        if isinstance(options, GuessitOptions):
+            data = options._data  # pylint:disable=protected-access
+        else:
+            if isinstance(options, Namespace):
+                options = vars(options)
+            data = {}
+            for key, value in parse_options(options).items():
+                data[_normalize_option(key)] = _normalize_option(value)
+        self._data = data
+        self._hash = None
+
+    def __getitem__(self, key):
+        return self._data[key]
+
+    def __iter__(self):
+        return iter(self._data)
+
+    def __len__(self):
+        return len(self._data)
+
+    def __getattr__(self, name):
+        if name.startswith('_'):
+            raise AttributeError(name)
+        try:
+            return self._data[name]
+        except KeyError:
+            raise AttributeError(name)
+
+    def __hash__(self):
+        if self._hash is None:
+            self._hash = hash(hashable(self._data))
+        return self._hash
+
+    def __eq__(self, other):
+        if isinstance(other, GuessitOptions):
+            return self._data == other._data  # pylint:disable=protected-access
+        return Mapping.__eq__(self, other)
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __reduce__(self):
+        return GuessitOptions, (self._data,)
+
+    def __repr__(self):
+        return '%s(%r)' % (self.__class__.__name__, self._data)
+
+
 argument_parser = build_argument_parser()
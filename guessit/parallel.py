@@ -0,0 +1,260 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Parallel guessing, using a pool of worker processes.
+"""
+from collections import deque
+import multiprocessing
+
+import six
+from six.moves import queue
+from rebulk.match import Match, MatchesDict
+
+from .api import GuessItApi, GuessitException, _copy_result
+from .rules import rebulk_builder
+
+DEFAULT_CHUNKSIZE = 64
+DEFAULT_TIMEOUT = 300
+
+_worker_api = None  # pylint:disable=invalid-name
+
+
+def _init_worker():
+    """
+    Build the rebulk object once, when the worker process starts.
+    """
+    global _worker_api  # pylint:disable=global-statement,invalid-name
+    _worker_api = GuessItApi(rebulk_builder())
+
+
+def _portable_match(match):
+    """
+    Copy a match without its pattern, formatter and children, so it can be sent back to the main process.
+    """
+    ret = Match(match.start, match.end, value=match.value, name=match.name, tags=list(match.tags),
+                private=match.private, input_string=match.input_string)
+    ret.raw_start = match.raw_start
+    ret.raw_end = match.raw_end
+    if match.parent:
+        ret.parent = _portable_match(match.parent)
+    return ret
+
+
+def _portable_result(result):
+    """
+    Copy a guess result as plain data, so it can be sent back to the main process.
+
+    MatchesDict itself can't be unpickled on python 2, as OrderedDict rebuilds it with items as argument.
+    :param result:
+    :type result: MatchesDict
+    :return: items, matches and values_list of the result, with portable matches.
+    :rtype: tuple
+    """
+    result = _copy_result(result, _portable_match)
+    return list(result.items()), dict(result.matches), dict(result.values_list)
+
+
+def _restore_result(data):
+    """
+    Rebuild a guess result from data returned by _portable_result.
+    :param data:
+    :type data: tuple
+    :return:
+    :rtype: MatchesDict
+    """
+    items, matches, values_list = data
+    ret = MatchesDict()
+    for key, value in items:
+        ret[key] = value
+    ret.matches.update(matches)
+    ret.values_list.update(values_list)
+    return ret
+
+
+def _restore_chunk(chunk_results):
+    """
+    Rebuild guess results of a chunk returned by _guess_chunk.
+    :param chunk_results:
+    :type chunk_results: list[tuple]
+    :return: (string, result) tuples
+    :rtype: list[tuple]
+    """
+    return [(string, result if isinstance(result, GuessitException) else _restore_result(result))
+            for string, result in chunk_results]
+
+
+def _guess_chunk(strings, options):
+    """
+    Guess a chunk of strings in a worker process.
+
+    The rebulk object is built on first call if the worker process wasn't started with _init_worker.
+    :param strings:
+    :type strings: list[str]
+    :param options: options prepared by GuessItApi
+    :type options: GuessitOptions
+    :return: (string, result) tuples, with results as returned by _portable_result.
+    :rtype: list[tuple]
+    """
+    if _worker_api is None:
+        _init_worker()
+    ret = []
+    for string in strings:
+        try:
+            result = _portable_result(_worker_api._guess(string, options))  # pylint:disable=protected-access
+        except:  # pylint:disable=bare-except
+            result = GuessitException(string, options)
+        ret.append((string, result))
+    return ret
+
+
+def _chunks(iterable, chunksize):
+    """
+    Split an iterable in lists of chunksize items, lazily.
+    """
+    chunk = []
+    for item in iterable:
+        chunk.append(item)
+        if len(chunk) >= chunksize:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+class GuessItPool(object):
+    """
+    A pool of worker processes that guess names in parallel.
+
+    Names are sent to workers in chunks, and at most two chunks per worker are pending at any time, so that
+    input iterables are consumed lazily. Worker processes are started when the first chunk is sent.
+    """
+
+    def __init__(self, processes=None, chunksize=DEFAULT_CHUNKSIZE, timeout=DEFAULT_TIMEOUT):
+        """
+        :param processes: number of worker processes. If None, the number of CPU cores is used.
+        :type processes: int
+        :param chunksize: number of names sent to a worker at once.
+        :type chunksize: int
+        :param timeout: seconds to wait for the results of a chunk before raising multiprocessing.TimeoutError.
+        If None, wait forever.
+        :type timeout: float
+        """
+        self.processes = processes or multiprocessing.cpu_count()
+        self.chunksize = chunksize
+        self.timeout = timeout
+        self._pool = None
+
+    def _submit(self, chunk, options, completed=None):
+        """
+        Send a chunk to the workers, starting them if required.
+
+        If completed queue is given, chunk results, or the exception raised by the worker, are put in it.
+        """
+        if self._pool is None:
+            self._pool = multiprocessing.Pool(self.processes, initializer=_init_worker)
+        if completed is None:
+            return self._pool.apply_async(_guess_chunk, (chunk, options))
+        kwargs = {'error_callback': completed.put} if six.PY3 else {}
+        return self._pool.apply_async(_guess_chunk, (chunk, options), callback=completed.put, **kwargs)
+
+    def _next_chunk(self, pending, completed):
+        """
+        Wait for the oldest pending chunk, or for any chunk if completed queue is given, and retrieves its results.
+        """
+        if completed is None:
+            return _restore_chunk(pending.popleft().get(self.timeout))
+        pending.popleft()  # chunks complete in any order, only their count matters.
+        try:
+            chunk_results = completed.get(timeout=self.timeout)
+        except queue.Empty:
+            raise multiprocessing.TimeoutError()
+        if isinstance(chunk_results, Exception):
+            raise chunk_results
+        return _restore_chunk(chunk_results)
+
+    def guessit_many(self, strings, options=None, ordered=True):
+        """
+        Retrieves all matches from each string of an iterable, lazily.
+
+        When a guess fails, the GuessitException is yielded instead of the result.
+
+        Result matches are detached from patterns used to build them, so they can be sent across processes.
+        :param strings: filenames or release names
+        :type strings: iterable[str]
+        :param options:
+        :type options: str|dict|GuessitOptions
+        :param ordered: if True, results are yielded in input order. Otherwise, they are yielded as soon as their
+        chunk is completed.
+        :type ordered: bool
+        :return: (string, result) tuples
+        :rtype: iterator[tuple]
+        """
+        try:
+            options = GuessItApi._prepare_options(options)  # pylint:disable=protected-access
+        except:
+            raise GuessitException(None, options)
+
+        pending = deque()
+        completed = None if ordered else queue.Queue()
+        for chunk in _chunks(strings, self.chunksize):
+            pending.append(self._submit(chunk, options, completed))
+            if len(pending) >= 2 * self.processes:
+                for item in self._next_chunk(pending, completed):
+                    yield item
+        while pending:
+            for item in self._next_chunk(pending, completed):
+                yield item
+
+    def close(self):
+        """
+        Stop the worker processes, once all pending work is done.
+        """
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+
+    def terminate(self):
+        """
+        Stop the worker processes immediately.
+        """
+        if self._pool is not None:
+            self._pool.terminate()
+            self._pool.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.close()
+        else:
+            self.terminate()
+
+
+def guessit_many(strings, options=None, processes=None, chunksize=DEFAULT_CHUNKSIZE, ordered=True,
+                 timeout=DEFAULT_TIMEOUT):
+    """
+    Retrieves all matches from each string of an iterable, using a temporary pool of worker processes.
+    :param strings: filenames or release names
+    :type strings: iterable[str]
+    :param options:
+    :type options: str|dict|GuessitOptions
+    :param processes: number of worker processes. If None, the number of CPU cores is used.
+    :type processes: int
+    :param chunksize: number of names sent to a worker at once.
+    :type chunksize: int
+    :param ordered: if True, results are yielded in input order, else in completion order.
+    :type ordered: bool
+    :param timeout: seconds to wait for the results of a chunk before raising multiprocessing.TimeoutError.
+    :type timeout: float
+    :return: (string, result) tuples
+    :rtype: iterator[tuple]
+    """
+    pool = GuessItPool(processes, chunksize, timeout)
+    try:
+        for item in pool.guessit_many(strings, options, ordered):
+            yield item
+    except:
+        pool.terminate()
+        raise
+    pool.close()
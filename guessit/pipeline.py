@@ -0,0 +1,104 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Pipelines of patterns and rules, specialized for given options.
+"""
+from itertools import groupby
+from logging import getLogger
+
+from rebulk import Rebulk, debug
+from rebulk.match import Matches
+
+try:
+    from rebulk.rules import execute_rule, toposort_rules
+    SUPPORTED = True
+except ImportError:  # pragma: no cover
+    # Those rebulk internals may be missing from other rebulk versions, Rebulk.matches is used instead.
+    SUPPORTED = False
+
+_loggers = (getLogger('rebulk.rebulk'), getLogger('rebulk.rules'))
+
+
+def supported(rebulk):
+    """
+    Check if pipelines can be used for the given Rebulk object.
+
+    Pipelines reimplement Rebulk.matches, so overrides of Rebulk subclasses would be ignored.
+    :param rebulk:
+    :type rebulk: rebulk.Rebulk
+    :return:
+    :rtype: bool
+    """
+    return SUPPORTED and type(rebulk) is Rebulk  # pylint:disable=unidiomatic-typecheck
+
+
+def logging_enabled():
+    """
+    Check if rebulk logs patterns and rules activity. Pipelines don't, so Rebulk.matches should be used instead.
+    :return:
+    :rtype: bool
+    """
+    return any(logger.isEnabledFor(debug.LOG_LEVEL) for logger in _loggers)
+
+
+def ordered_rules(rules):
+    """
+    Get rules in the order rebulk executes them: by priority, then by dependency, then by definition order.
+    :param rules:
+    :type rules: rebulk.rules.Rules
+    :return:
+    :rtype: list[rebulk.rules.Rule]
+    """
+    ret = []
+    for _, priority_rules in groupby(sorted(rules), lambda rule: rule.priority):
+        for rules_group in toposort_rules(list(priority_rules)):
+            ret.extend(sorted(rules_group, key=rules.index))
+    return ret
+
+
+class Pipeline(object):
+    """
+    Patterns and rules of a Rebulk object that are enabled for given options, resolved once.
+
+    Rebulk resolves effective patterns and rules, and sorts rules by priority and dependency, on each call. A
+    pipeline does it once, so guesses using the same options only run enabled patterns and rules, in the same order.
+
+    Patterns `disabled` and rules `enabled` functions should only depend on options. Unlike Rebulk.matches,
+    pipelines don't log found matches and executed rules.
+    """
+
+    def __init__(self, rebulk, options):
+        """
+        :param rebulk:
+        :type rebulk: rebulk.Rebulk
+        :param options:
+        :type options: guessit.options.GuessitOptions
+        """
+        self.patterns = []
+        self.rules = []
+        if not rebulk.disabled(options):
+            self.patterns = [pattern for pattern in rebulk.effective_patterns(options)
+                             if not pattern.disabled(options)]
+            self.rules = [rule for rule in ordered_rules(rebulk.effective_rules(options))
+                          if rule.enabled(options)]
+
+    def matches(self, string, options):
+        """
+        Search for all matches of enabled patterns and execute enabled rules, like Rebulk.matches does.
+        :param string:
+        :type string: str
+        :param options: the options this pipeline was built for
+        :type options: guessit.options.GuessitOptions
+        :return:
+        :rtype: Matches
+        """
+        matches = Matches(input_string=string)
+        for pattern in self.patterns:
+            for match in pattern.matches(string, options):
+                if match.marker:
+                    matches.markers.append(match)
+                else:
+                    matches.append(match)
+        for rule in self.rules:
+            execute_rule(rule, matches, options)
+        return matches
@@ -0,0 +1,126 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Profiling of patterns and rules
+"""
+try:
+    from collections import OrderedDict
+except ImportError:  # pragma: no-cover
+    from ordereddict import OrderedDict  # pylint:disable=import-error
+
+from timeit import default_timer
+
+
+class Profiler(object):
+    """
+    Records wall time and call counts of patterns, grouped by builder, and of each rule when and then methods.
+
+    Patterns and rules of the api Rebulk instance are instrumented while the profiler is started, so all guesses
+    performed with this api in the meantime are recorded, whatever the thread they run in.
+
+    >>> from guessit import guessit
+    >>> with Profiler() as profiler:
+    ...     guess = guessit('Treme.1x03.Right.Place,.Wrong.Time.HDTV.XviD-NoTV.avi')
+    >>> row = profiler.report()[0]
+    >>> list(row.keys())
+    ['builder', 'name', 'calls', 'time']
+    """
+
+    def __init__(self, api=None, timer=default_timer):
+        """
+        :param api: api to profile. If None, default api is used.
+        :type api: guessit.api.GuessItApi
+        :param timer: function returning current time, in seconds.
+        :type timer: callable
+        """
+        self.api = api
+        self.timer = timer
+        self.records = OrderedDict()
+        self._instrumented = []
+
+    def _instrument(self, obj, attribute, key):
+        """
+        Replace a method of obj with a wrapper recording its calls under given key.
+        """
+        func = getattr(obj, attribute)
+        record = self.records.setdefault(key, [0, 0.0])
+        timer = self.timer
+
+        def wrapper(*args, **kwargs):
+            """
+            Record wall time and call count of wrapped method.
+            """
+            start = timer()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                record[0] += 1
+                record[1] += timer() - start
+
+        self._instrumented.append((obj, attribute, obj.__dict__.get(attribute)))
+        setattr(obj, attribute, wrapper)
+
+    def start(self):
+        """
+        Instrument patterns and rules of the api Rebulk instance.
+        """
+        if self._instrumented:
+            return
+        if self.api is None:
+            from .api import default_api
+            self.api = default_api
+        rebulk = self.api.rebulk
+        for index, child in enumerate([rebulk] + rebulk._rebulks):  # pylint:disable=protected-access
+            builder = getattr(child, 'builder_name', 'rebulk' if child is rebulk else 'rebulk-%i' % index)
+            for pattern in child._patterns:  # pylint:disable=protected-access
+                self._instrument(pattern, 'matches', (builder, 'patterns'))
+            for rule in child._rules:  # pylint:disable=protected-access
+                self._instrument(rule, 'when', (builder, type(rule).__name__ + '.when'))
+                self._instrument(rule, 'then', (builder, type(rule).__name__ + '.then'))
+
+    def stop(self):
+        """
+        Restore original patterns and rules methods. Recorded data is kept.
+        """
+        while self._instrumented:
+            obj, attribute, original = self._instrumented.pop()
+            if original is None:
+                delattr(obj, attribute)
+            else:
+                setattr(obj, attribute, original)
+
+    def reset(self):
+        """
+        Clear recorded data.
+        """
+        for record in self.records.values():
+            record[0] = 0
+            record[1] = 0.0
+
+    def report(self):
+        """
+        Retrieves recorded data, most time consuming first.
+
+        Each row contains builder, name (patterns or rule method), calls and time (in seconds) keys, so it can
+        be exported as json or csv.
+        :return:
+        :rtype: list[OrderedDict]
+        """
+        ret = []
+        for (builder, name), (calls, time) in self.records.items():
+            if calls:
+                row = OrderedDict()
+                row['builder'] = builder
+                row['name'] = name
+                row['calls'] = calls
+                row['time'] = time
+                ret.append(row)
+        ret.sort(key=lambda row: row['time'], reverse=True)
+        return ret
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
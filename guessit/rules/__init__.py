@@ -18,8 +18,8 @@ from .properties.website import website
 from .properties.date import date
 from .properties.title import title
 from .properties.episode_title import episode_title
-from .properties.language import language
-from .properties.country import country
+from .properties.language import language, guessit_converter
+from .properties.country import country, guessit_country_converter
 from .properties.release_group import release_group
 from .properties.streaming_service import streaming_service
 from .properties.other import other
@@ -34,6 +34,9 @@ from .properties.type import type_
 
 from .processors import processors
 
+from .common.keywords import index_keywords
+from .common.prefilter import prefilter_regexes
+
 
 def rebulk_builder():
     """
@@ -43,35 +46,18 @@ def rebulk_builder():
     """
     rebulk = Rebulk()
 
-    rebulk.rebulk(path())
-    rebulk.rebulk(groups())
-
-    rebulk.rebulk(episodes())
-    rebulk.rebulk(container())
-    rebulk.rebulk(format_())
-    rebulk.rebulk(video_codec())
-    rebulk.rebulk(audio_codec())
-    rebulk.rebulk(screen_size())
-    rebulk.rebulk(website())
-    rebulk.rebulk(date())
-    rebulk.rebulk(title())
-    rebulk.rebulk(episode_title())
-    rebulk.rebulk(language())
-    rebulk.rebulk(country())
-    rebulk.rebulk(release_group())
-    rebulk.rebulk(streaming_service())
-    rebulk.rebulk(other())
-    rebulk.rebulk(edition())
-    rebulk.rebulk(cds())
-    rebulk.rebulk(bonus())
-    rebulk.rebulk(film())
-    rebulk.rebulk(part())
-    rebulk.rebulk(crc())
+    for builder in (path, groups,
+                    episodes, container, format_, video_codec, audio_codec, screen_size, website, date, title,
+                    episode_title, language, country, release_group, streaming_service, other, edition, cds, bonus,
+                    film, part, crc,
+                    processors,
+                    mimetype, type_):
+        child = builder()
+        child.builder_name = builder.__module__.rsplit('.', 1)[-1]  # Used to identify patterns and rules origin
+        rebulk.rebulk(child)
 
-    rebulk.rebulk(processors())
-
-    rebulk.rebulk(mimetype())
-    rebulk.rebulk(type_())
+    rebulk.keyword_index = index_keywords(rebulk)
+    prefilter_regexes(rebulk)
 
     def customize_properties(properties):
         """
@@ -88,3 +74,17 @@ def rebulk_builder():
     rebulk.customize_properties = customize_properties
 
     return rebulk
+
+
+def build_tables(rebulk):
+    """
+    Build lookup tables that are otherwise built on first use: language and country words, and the keywords index
+    of given rebulk object.
+    :param rebulk: Main Rebulk object
+    :type rebulk: Rebulk
+    """
+    guessit_converter.words  # pylint:disable=pointless-statement
+    guessit_country_converter.words  # pylint:disable=pointless-statement
+    keyword_index = getattr(rebulk, 'keyword_index', None)
+    if keyword_index is not None:
+        keyword_index.build()
@@ -12,3 +12,31 @@ title_seps = r'-+/\|'  # separators for title
 
 dash = (r'-', r'['+re.escape(seps_no_fs)+']')  # abbreviation used by many rebulk objects.
 alt_dash = (r'@', r'['+re.escape(seps_no_fs)+']')  # abbreviation used by many rebulk objects.
+
+
+def property_disabled(context, *names):
+    """
+    Check if patterns and rules producing only given properties can be skipped, because only other properties are
+    requested with only_properties option.
+
+    >>> property_disabled({'only_properties': ['title', 'year']}, 'mimetype')
+    True
+    >>> property_disabled({'only_properties': ['title', 'year']}, 'year')
+    False
+    >>> property_disabled({}, 'mimetype')
+    False
+
+    :param context:
+    :type context: dict
+    :param names: properties produced
+    :type names: str
+    :return:
+    :rtype: bool
+    """
+    only_properties = context.get('only_properties') if context else None
+    if not only_properties:
+        return False
+    for name in names:
+        if name in only_properties:
+            return False
+    return True
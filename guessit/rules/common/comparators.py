@@ -3,10 +3,6 @@
 """
 Comparators
 """
-try:
-    from functools import cmp_to_key
-except ImportError:
-    from ...backports import cmp_to_key
 
 
 def marker_comparator_predicate(match):
@@ -59,6 +55,8 @@ def marker_sorted(markers, matches):
     """
     Sort markers from matches, from the most valuable to the less.
 
+    It gives the same order than marker_comparator, but each marker weight is computed only once.
+
     :param fileparts:
     :type fileparts:
     :param matches:
@@ -66,4 +64,5 @@ def marker_sorted(markers, matches):
     :return:
     :rtype:
     """
-    return sorted(markers, key=cmp_to_key(marker_comparator(matches, markers)))
+    keys = [(-marker_weight(matches, marker), -len(marker), -index) for index, marker in enumerate(markers)]
+    return [markers[i] for i in sorted(range(len(markers)), key=keys.__getitem__)]
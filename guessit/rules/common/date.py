@@ -3,7 +3,8 @@
 """
 Date
 """
-from dateutil import parser
+import datetime
+import time
 
 from rebulk.remodule import re
 
@@ -20,6 +21,8 @@ date_regexps = [
     re.compile(r'(?:^|[^\d])((\d{1,2}(?:st|nd|rd|th)?%s(?:[a-z]{3,10})%s\d{4}))(?:$|[^\d])' % (_dsep, _dsep),
                re.IGNORECASE)]
 
+_numeric_date_re = re.compile(r'[0-9]+(?:-[0-9]+)*$')
+
 
 def valid_year(year):
     """Check if number is a valid year"""
@@ -67,6 +70,109 @@ def _guess_day_first_parameter(groups):
         return True
 
 
+def _convert_year(year):
+    """
+    Convert a two digits year to the nearest year from today, the same way dateutil does.
+
+    :param year:
+    :type year: int
+    :return:
+    :rtype: int
+    """
+    current_year = time.localtime().tm_year
+    year += current_year // 100 * 100
+    if year >= current_year + 50:
+        year -= 100
+    elif year < current_year - 50:
+        year += 100
+    return year
+
+
+def _parse_numeric_date(match, year_first, day_first):
+    """
+    Parse a numeric date found by date regexps, giving the same result as dateutil parser.
+
+    It avoids calling dateutil, which is slow, for all dates except those having a textual month.
+
+    >>> _parse_numeric_date('2002-04-22', False, False)
+    datetime.date(2002, 4, 22)
+
+    >>> _parse_numeric_date('020422', True, False)
+    datetime.date(2002, 4, 22)
+
+    >>> _parse_numeric_date('20-02-2017', False, False)
+    datetime.date(2017, 2, 20)
+
+    :param match: digits, either 8 digits, 6 digits or three numbers separated by "-".
+    :type match: str
+    :param year_first:
+    :type year_first: bool
+    :param day_first:
+    :type day_first: bool
+    :return: the date, or None if it's not a valid date.
+    :rtype: datetime.date
+    """
+    tokens = match.split('-')
+    if len(tokens) == 1:
+        token = tokens[0]
+        if len(token) == 8:
+            tokens = [token[:4], token[4:6], token[6:]]
+        elif len(token) == 6:
+            tokens = [token[:2], token[2:4], token[4:]]
+    if len(tokens) != 3:
+        return None
+
+    long_tokens = [i for i, token in enumerate(tokens) if len(token) > 2]
+    if len(long_tokens) > 1:
+        return None
+    values = [int(token) for token in tokens]
+
+    if values[0] > 31 or long_tokens == [0] or (year_first and values[1] <= 12 and values[2] <= 31):
+        if day_first and values[2] <= 12:
+            year, day, month = values
+        else:
+            year, month, day = values
+    elif values[0] > 12 or (day_first and values[1] <= 12):
+        day, month, year = values
+    else:
+        month, day, year = values
+
+    if year < 100 and not long_tokens:
+        year = _convert_year(year)
+
+    try:
+        return datetime.date(year, month, day)
+    except ValueError:
+        return None
+
+
+def _parse_date(match, dayfirst, yearfirst):
+    """
+    Parse a date found by date regexps.
+
+    Numeric dates are parsed natively, and dateutil is only used for dates having a textual month.
+
+    :param match:
+    :type match: str
+    :param dayfirst:
+    :type dayfirst: bool
+    :param yearfirst:
+    :type yearfirst: bool
+    :return: the date, or None if it can't be parsed.
+    :rtype: datetime.date
+    """
+    if _numeric_date_re.match(match):
+        return _parse_numeric_date(match, yearfirst, dayfirst)
+
+    from dateutil import parser  # lazy import, as dateutil is slow to import and only required for textual dates
+
+    try:
+        return parser.parse(match, dayfirst=dayfirst, yearfirst=yearfirst).date()
+    except (ValueError, TypeError):  # pragma: no cover
+        # see https://bugs.launchpad.net/dateutil/+bug/1247643
+        return None
+
+
 def search_date(string, year_first=None, day_first=None):
     """Looks for date patterns, and if found return the date and group span.
 
@@ -114,12 +220,8 @@ def search_date(string, year_first=None, day_first=None):
         kwargs_list = ({'dayfirst': d, 'yearfirst': y}
                        for d in dayfirst_opts for y in yearfirst_opts)
         for kwargs in kwargs_list:
-            try:
-                date = parser.parse(match, **kwargs)
-            except (ValueError, TypeError):  # pragma: no cover
-                # see https://bugs.launchpad.net/dateutil/+bug/1247643
-                date = None
+            date = _parse_date(match, **kwargs)
 
             # check date plausibility
-            if date and valid_year(date.year):  # pylint:disable=no-member
-                return start, end, date.date()  # pylint:disable=no-member
+            if date and valid_year(date.year):
+                return start, end, date
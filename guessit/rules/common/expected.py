@@ -0,0 +1,127 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Expected title and group matchers, compiled once for each list of expected values.
+"""
+from rebulk import Rebulk
+from rebulk.pattern import RePattern
+from rebulk.remodule import re
+
+from . import dash
+from .keywords import KeywordIndex, index_keywords
+from .prefilter import RegexPrefilter, mergeable
+from ...cache import LRUCache
+
+_expected_matchers = LRUCache(maxsize=32)
+_expected_rebulks = LRUCache(maxsize=32)
+
+
+def _expected_regex(expected):
+    """
+    Get the regular expression of an expected value prefixed with "re:", or None if it's a plain string.
+    """
+    if expected.startswith('re:'):
+        return expected[3:].replace(' ', '-')
+    return None
+
+
+class ExpectedMatcher(object):
+    """
+    Finds all expected values in a string.
+
+    Plain strings are found with a single scan, whatever their count, and regular expressions are only searched
+    when a merged prefilter finds one of them.
+
+    >>> ExpectedMatcher(['The Show', 're:Other Show']).spans('the.show.and.the.other-show')
+    [(17, 27)]
+    >>> ExpectedMatcher(['The Show', 're:Other Show']).spans('The Show and the Other Show')
+    [(0, 8), (17, 27)]
+    """
+
+    def __init__(self, expected):
+        """
+        :param expected: expected values. Values prefixed with "re:" are regular expressions.
+        :type expected: list[str]
+        """
+        self._index = KeywordIndex()
+        self._keywords = {}
+        self._regexes = []
+        self._prefilter = RegexPrefilter(re.IGNORECASE)
+        for i, value in enumerate(expected):
+            regex = _expected_regex(value)
+            if regex is not None:
+                pattern = RePattern(regex, abbreviations=[dash], flags=re.IGNORECASE)
+                prefiltered = all(mergeable(compiled) for compiled in pattern.patterns)
+                if prefiltered:
+                    for compiled in pattern.patterns:
+                        self._prefilter.add(compiled)
+                self._regexes.append((i, pattern, prefiltered))
+            elif value:
+                self._index.add(value, ignore_case=True)
+                self._keywords.setdefault(value.lower(), []).append(i)
+
+    def spans(self, input_string):
+        """
+        Find spans of all expected values, in expected values order.
+        :param input_string:
+        :type input_string: str
+        :return:
+        :rtype: list[tuple]
+        """
+        found = []
+        if self._keywords:
+            for keyword, positions in self._index.find(input_string).get(True, {}).items():
+                spans = [(start, start + len(keyword)) for start in positions]
+                for i in self._keywords[keyword]:
+                    found.append((i, spans))
+        if self._regexes:
+            prefilter_found = self._prefilter.search(input_string)
+            for i, pattern, prefiltered in self._regexes:
+                if prefilter_found or not prefiltered:
+                    spans = [match.span for match in pattern.matches(input_string)]
+                    if spans:
+                        found.append((i, spans))
+        found.sort(key=lambda item: item[0])
+        return [span for _, spans in found for span in spans]
+
+
+def expected_matcher(expected):
+    """
+    Get the matcher of expected values, built on first use for each list of expected values.
+    :param expected:
+    :type expected: list[str]
+    :return:
+    :rtype: ExpectedMatcher
+    """
+    key = tuple(expected)
+    matcher = _expected_matchers.get(key)
+    if matcher is None:
+        matcher = ExpectedMatcher(key)
+        _expected_matchers.set(key, matcher)
+    return matcher
+
+
+def expected_rebulk(expected, name):
+    """
+    Get a Rebulk object finding expected values as matches with given name, built on first use for each list of
+    expected values.
+    :param expected:
+    :type expected: list[str]
+    :param name:
+    :type name: str
+    :return:
+    :rtype: Rebulk
+    """
+    key = (tuple(expected), name)
+    rebulk = _expected_rebulks.get(key)
+    if rebulk is None:
+        rebulk = Rebulk().defaults(name=name)
+        for value in expected:
+            regex = _expected_regex(value)
+            if regex is not None:
+                rebulk.regex(regex, abbreviations=[dash], flags=re.IGNORECASE)
+            else:
+                rebulk.string(value, ignore_case=True)
+        index_keywords(rebulk)
+        _expected_rebulks.set(key, rebulk)
+    return rebulk
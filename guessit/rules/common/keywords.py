@@ -0,0 +1,180 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Keywords index, finding all literal string patterns in a single pass.
+"""
+import re
+import threading
+
+from rebulk.match import Match
+from rebulk.pattern import StringPattern
+
+from ...reutils import build_trie_pattern
+
+
+class KeywordIndex(object):
+    """
+    Finds occurrences of many keywords with a single regular expression scan of the input string.
+
+    Occurrences are the same as the ones rebulk finds with a scan for each keyword: they may overlap occurrences of
+    other keywords, but not occurrences of the same keyword.
+
+    >>> index = KeywordIndex()
+    >>> index.add('DD', ignore_case=True)
+    >>> index.add('DD5', ignore_case=True)
+    >>> index.positions('Movie.dd5.1.DDD', 'DD', ignore_case=True)
+    (6, 12)
+    >>> index.positions('Movie.dd5.1.DDD', 'DD5', ignore_case=True)
+    (6,)
+    """
+
+    def __init__(self):
+        self._keywords = {False: set(), True: set()}
+        self._compiled = None
+        self._lock = threading.Lock()
+        self._last = threading.local()
+
+    def add(self, keyword, ignore_case=False):
+        """
+        Register a keyword to find.
+        :param keyword:
+        :type keyword: str
+        :param ignore_case:
+        :type ignore_case: bool
+        """
+        if ignore_case:
+            keyword = keyword.lower()
+        with self._lock:
+            if keyword not in self._keywords[ignore_case]:
+                self._keywords[ignore_case].add(keyword)
+                self._compiled = None
+
+    def _compile(self):
+        """
+        Build the scanning regular expressions, and for each keyword the list of keywords it starts with.
+
+        The regular expression is a prefix trie matching the longest keyword at each position of the input string,
+        so the other keywords found at this position are its prefixes.
+        """
+        compiled = {}
+        for ignore_case, keywords in self._keywords.items():
+            if not keywords:
+                continue
+            keywords = sorted(keywords, key=lambda keyword: (-len(keyword), keyword))
+            regex = re.compile('(?=(' + build_trie_pattern(keywords) + '))')
+            prefixes = {}
+            for keyword in keywords:
+                prefixes[keyword] = [prefix for prefix in reversed(keywords) if keyword.startswith(prefix)]
+            compiled[ignore_case] = (regex, prefixes)
+        return compiled
+
+    def build(self):
+        """
+        Build the scanning regular expressions if keywords were added since last build.
+
+        It's done on first find otherwise.
+        :return: regular expression and prefixes of keywords, indexed by ignore_case flag.
+        :rtype: dict[bool, tuple]
+        """
+        compiled = self._compiled
+        if compiled is None:
+            with self._lock:
+                if self._compiled is None:
+                    self._compiled = self._compile()
+                compiled = self._compiled
+        return compiled
+
+    def find(self, input_string):
+        """
+        Find occurrences of all registered keywords.
+
+        Result for the last input string is kept for each thread, so patterns of the same parsing share a single
+        scan.
+        :param input_string:
+        :type input_string: str
+        :return: positions of each keyword, indexed by ignore_case flag and keyword.
+        :rtype: dict[bool, dict[str, list[int]]]
+        """
+        last = getattr(self._last, 'value', None)
+        if last is not None and last[0] == input_string and last[1] is self._compiled:
+            return last[2]
+
+        compiled = self.build()
+
+        ret = {}
+        for ignore_case, (regex, prefixes) in compiled.items():
+            string = input_string.lower() if ignore_case else input_string
+            positions = {}
+            ends = {}
+            for match in regex.finditer(string):
+                start = match.start()
+                for keyword in prefixes[match.group(1)]:
+                    if start >= ends.get(keyword, 0):
+                        positions.setdefault(keyword, []).append(start)
+                        ends[keyword] = start + len(keyword)
+            ret[ignore_case] = positions
+
+        self._last.value = (input_string, compiled, ret)
+        return ret
+
+    def positions(self, input_string, keyword, ignore_case=False):
+        """
+        Get positions of a registered keyword in input string.
+        :param input_string:
+        :type input_string: str
+        :param keyword:
+        :type keyword: str
+        :param ignore_case:
+        :type ignore_case: bool
+        :return:
+        :rtype: tuple[int]
+        """
+        if ignore_case:
+            keyword = keyword.lower()
+        return tuple(self.find(input_string).get(ignore_case, {}).get(keyword, ()))
+
+
+class KeywordPattern(StringPattern):
+    """
+    String pattern retrieving its occurrences from a KeywordIndex shared with other patterns.
+    """
+
+    def __init__(self, index, *patterns, **kwargs):
+        super(KeywordPattern, self).__init__(*patterns, **kwargs)
+        self.index = index
+        self._ignore_case = bool(kwargs.get('ignore_case'))
+        for pattern in patterns:
+            index.add(pattern, self._ignore_case)
+
+    def _match(self, pattern, input_string, context=None):
+        for index in self.index.positions(input_string, pattern, self._ignore_case):
+            yield Match(index, index + len(pattern), pattern=self, input_string=input_string, **self._match_kwargs)
+
+
+def index_keywords(rebulk, index=None):
+    """
+    Replace string patterns of a rebulk object and its children with keyword patterns sharing the same index, so
+    all keywords are found with a single scan of the input string.
+
+    Patterns restricted to a slice of the input string and empty keywords are kept as is.
+    :param rebulk:
+    :type rebulk: rebulk.Rebulk
+    :param index:
+    :type index: KeywordIndex
+    :return: the index
+    :rtype: KeywordIndex
+    """
+    if index is None:
+        index = KeywordIndex()
+    patterns = rebulk._patterns  # pylint:disable=protected-access
+    for i, pattern in enumerate(patterns):
+        if type(pattern) is not StringPattern or not all(pattern.patterns):  # pylint:disable=unidiomatic-typecheck
+            continue
+        kwargs = pattern._kwargs  # pylint:disable=protected-access
+        if kwargs.get('start') is None and kwargs.get('end') is None:
+            keyword_pattern = KeywordPattern(index, *pattern.patterns, **kwargs)
+            keyword_pattern.defined_at = pattern.defined_at
+            patterns[i] = keyword_pattern
+    for child in rebulk._rebulks:  # pylint:disable=protected-access
+        index_keywords(child, index)
+    return index
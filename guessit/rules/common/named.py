@@ -0,0 +1,164 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Matches queries restricted to given names or tag.
+
+They give the same results as rebulk queries with a predicate checking match names or tags, but only look at matches
+having those names or tag, using the names and tags indexes of rebulk instead of calling the predicate for each match.
+"""
+import six
+from rebulk.loose import filter_index
+
+
+def _names(names):
+    """
+    Get names as a tuple.
+    """
+    if isinstance(names, six.string_types):
+        return (names,)
+    return tuple(names)
+
+
+def _named(matches, names):
+    """
+    Get matches having one of given names, in matches order.
+    :param matches:
+    :type matches: rebulk.match._BaseMatches
+    :param names:
+    :type names: tuple[str]
+    :return:
+    :rtype: list[rebulk.match.Match]
+    """
+    if len(names) == 1:
+        # Don't query absent names, as rebulk would register them in matches names.
+        if names[0] in matches.names:
+            return matches.named(names[0])
+        return []
+    return [match for match in matches if match.name in names]
+
+
+def _range(matches, candidates, start, end, index):
+    """
+    Retrieves candidates in given range, sorted from start to end, like matches.range does.
+    """
+    if end is None:
+        end = matches.max_end
+    else:
+        end = min(matches.max_end, end)
+    ret = sorted([match for match in candidates if match.start < end and match.end > start])
+    return filter_index(ret, index=index)
+
+
+def range_named(matches, start, end, names, index=None):
+    """
+    Retrieves matches having one of given names in given range, sorted from start to end.
+
+    Same as matches.range(start, end, lambda match: match.name in names, index).
+    :param matches:
+    :type matches: rebulk.match._BaseMatches
+    :param start:
+    :type start: int
+    :param end:
+    :type end: int
+    :param names:
+    :type names: str|list[str]
+    :param index:
+    :type index: int
+    :return:
+    :rtype: list[rebulk.match.Match]|rebulk.match.Match
+    """
+    return _range(matches, _named(matches, _names(names)), start, end, index)
+
+
+def range_tagged(matches, start, end, tag, index=None):
+    """
+    Retrieves matches having given tag in given range, sorted from start to end.
+
+    Same as matches.range(start, end, lambda match: tag in match.tags, index).
+    :param matches:
+    :type matches: rebulk.match._BaseMatches
+    :param start:
+    :type start: int
+    :param end:
+    :type end: int
+    :param tag:
+    :type tag: str
+    :param index:
+    :type index: int
+    :return:
+    :rtype: list[rebulk.match.Match]|rebulk.match.Match
+    """
+    # Don't query absent tags, as rebulk would register them in matches tags.
+    candidates = matches.tagged(tag) if tag in matches.tags else []
+    return _range(matches, candidates, start, end, index)
+
+
+def previous_named(matches, match, names, index=None):
+    """
+    Retrieves the nearest previous matches, if they have one of given names.
+
+    Same as matches.previous(match, lambda match: match.name in names, index).
+    :param matches:
+    :type matches: rebulk.match._BaseMatches
+    :param match:
+    :type match: rebulk.match.Match
+    :param names:
+    :type names: str|list[str]
+    :param index:
+    :type index: int
+    :return:
+    :rtype: list[rebulk.match.Match]|rebulk.match.Match
+    """
+    names = _names(names)
+    for candidate in _named(matches, names):
+        if candidate.end <= match.start:
+            return matches.previous(match, lambda previous: previous.name in names, index)
+    return filter_index([], index=index)
+
+
+def next_named(matches, match, names, index=None):
+    """
+    Retrieves the nearest next matches, if they have one of given names.
+
+    Same as matches.next(match, lambda match: match.name in names, index).
+    :param matches:
+    :type matches: rebulk.match._BaseMatches
+    :param match:
+    :type match: rebulk.match.Match
+    :param names:
+    :type names: str|list[str]
+    :param index:
+    :type index: int
+    :return:
+    :rtype: list[rebulk.match.Match]|rebulk.match.Match
+    """
+    names = _names(names)
+    for candidate in _named(matches, names):
+        if candidate.start > match.start:
+            return matches.next(match, lambda next_match: next_match.name in names, index)
+    return filter_index([], index=index)
+
+
+def at_match_named(matches, match, names, index=None):
+    """
+    Retrieves matches having one of given names at first or last index of given match.
+
+    Same as matches.at_match(match, lambda match: match.name in names, index).
+    :param matches:
+    :type matches: rebulk.match._BaseMatches
+    :param match:
+    :type match: rebulk.match.Match
+    :param names:
+    :type names: str|list[str]
+    :param index:
+    :type index: int
+    :return:
+    :rtype: list[rebulk.match.Match]|rebulk.match.Match
+    """
+    candidates = _named(matches, _names(names))
+    first, last = match.start, match.end - 1
+    ret = [candidate for candidate in candidates if candidate.start <= first < candidate.end]
+    for candidate in candidates:
+        if candidate.start <= last < candidate.end and candidate not in ret:
+            ret.append(candidate)
+    return filter_index(ret, index=index)
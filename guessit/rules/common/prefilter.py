@@ -0,0 +1,135 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Regular expressions prefilter, merging regular expressions of a property in a single alternation.
+"""
+import threading
+
+import six
+from rebulk.pattern import RePattern
+from rebulk.remodule import re
+
+_named_group_re = re.compile(r'(?<!\\)\(\?P<\w+>')
+_unmergeable_re = re.compile(r'\(\?P=|\(\?\(|\\[1-9]|\(\?[aiLmsux]')
+
+
+def mergeable(regex):
+    """
+    Check if a compiled regular expression can be merged in an alternation.
+
+    Back references, conditional groups and inline flags would change meaning in the merged regular expression.
+    :param regex:
+    :type regex: compiled regular expression
+    :return:
+    :rtype: bool
+    """
+    return isinstance(regex.pattern, six.string_types) and not _unmergeable_re.search(regex.pattern)
+
+
+class RegexPrefilter(object):
+    """
+    Alternation of many regular expressions, telling with a single search if any of them can match.
+
+    >>> prefilter = RegexPrefilter(re.IGNORECASE)
+    >>> prefilter.add(re.compile(r'(?P<codec>DTS)-?HD', re.IGNORECASE))
+    >>> prefilter.add(re.compile(r'DD\\+', re.IGNORECASE))
+    >>> prefilter.search('Movie.dts-hd.mkv')
+    True
+    >>> prefilter.search('Movie.DD5.1.mkv')
+    False
+    """
+
+    def __init__(self, flags=0):
+        self.flags = flags
+        self._patterns = []
+        self._regex = None
+        self._last = threading.local()
+
+    def add(self, regex):
+        """
+        Add a regular expression to the alternation. Its named groups are discarded.
+        :param regex:
+        :type regex: compiled regular expression
+        """
+        self._patterns.append(_named_group_re.sub('(?:', regex.pattern))
+        self._regex = None
+
+    def search(self, input_string):
+        """
+        Check if any regular expression of the alternation matches input string.
+
+        Result for the last input string is kept for each thread, so patterns of the same parsing share a single
+        search.
+        :param input_string:
+        :type input_string: str
+        :return:
+        :rtype: bool
+        """
+        last = getattr(self._last, 'value', None)
+        if last is not None and last[0] == input_string:
+            return last[1]
+        regex = self._regex
+        if regex is None:
+            regex = re.compile('|'.join('(?:' + pattern + ')' for pattern in self._patterns), self.flags)
+            self._regex = regex
+        ret = regex.search(input_string) is not None
+        self._last.value = (input_string, ret)
+        return ret
+
+
+class PrefilteredRePattern(RePattern):
+    """
+    Regular expression pattern looking for matches only if its prefilter finds one.
+    """
+
+    def __init__(self, prefilter, *patterns, **kwargs):
+        super(PrefilteredRePattern, self).__init__(*patterns, **kwargs)
+        self.prefilter = prefilter
+
+    def _match(self, pattern, input_string, context=None):
+        if self.prefilter.search(input_string):
+            for match in super(PrefilteredRePattern, self)._match(pattern, input_string, context):
+                yield match
+
+
+def _iter_rebulks(rebulk):
+    """
+    Iterate a rebulk object and all its children.
+    """
+    yield rebulk
+    for child in rebulk._rebulks:  # pylint:disable=protected-access
+        for descendant in _iter_rebulks(child):
+            yield descendant
+
+
+def prefilter_regexes(rebulk):
+    """
+    Replace regular expression patterns of a rebulk object and its children with prefiltered patterns.
+
+    Regular expressions of patterns having the same name and flags are merged in a prefilter alternation, so when
+    none of them can match the input string, a single search is performed instead of one for each of them.
+    :param rebulk:
+    :type rebulk: rebulk.Rebulk
+    :return: prefilters, indexed by pattern name and flags.
+    :rtype: dict
+    """
+    prefilters = {}
+    for child in _iter_rebulks(rebulk):
+        patterns = child._patterns  # pylint:disable=protected-access
+        for i, pattern in enumerate(patterns):
+            if type(pattern) is not RePattern or not pattern.patterns:  # pylint:disable=unidiomatic-typecheck
+                continue
+            flags = set(regex.flags for regex in pattern.patterns)
+            if len(flags) != 1 or not all(mergeable(regex) for regex in pattern.patterns):
+                continue
+            key = (pattern.name, flags.pop())
+            prefilter = prefilters.get(key)
+            if prefilter is None:
+                prefilter = RegexPrefilter(key[1])
+                prefilters[key] = prefilter
+            for regex in pattern.patterns:
+                prefilter.add(regex)
+            prefiltered = PrefilteredRePattern(prefilter, *pattern.patterns, **pattern._kwargs)  # pylint:disable=protected-access
+            prefiltered.defined_at = pattern.defined_at
+            patterns[i] = prefiltered
+    return prefilters
@@ -4,11 +4,17 @@
 Words utils
 """
 from collections import namedtuple
+import re
+import threading
 
 from guessit.rules.common import seps
 
 _Word = namedtuple('_Word', ['span', 'value'])
 
+_words_re = re.compile('[^' + re.escape(seps) + ']+')  # Only ascii characters are separators.
+
+_last_lower_words = threading.local()
+
 
 def iter_words(string):
     """
@@ -18,20 +24,31 @@ def iter_words(string):
     :return:
     :rtype: iterable[str]
     """
-    i = 0
-    last_sep_index = -1
-    inside_word = False
-    for char in string:
-        if ord(char) < 128 and char in seps:  # Make sure we don't exclude unicode characters.
-            if inside_word:
-                yield _Word(span=(last_sep_index+1, i), value=string[last_sep_index+1:i])
-            inside_word = False
-            last_sep_index = i
-        else:
-            inside_word = True
-        i += 1
-    if inside_word:
-        yield _Word(span=(last_sep_index+1, i), value=string[last_sep_index+1:i])
+    for word_match in _words_re.finditer(string):
+        yield _Word(span=word_match.span(), value=word_match.group())
+
+
+def lower_words(string):
+    """
+    Get all words in a string, with lowercased values.
+
+    Result for the last string is kept for each thread, so functional patterns parsing the same input string
+    share a single tokenization.
+
+    >>> [word.value for word in lower_words('The.Movie.FRENCH')]
+    ['the', 'movie', 'french']
+
+    :param string:
+    :type string:
+    :return:
+    :rtype: tuple[_Word]
+    """
+    last = getattr(_last_lower_words, 'value', None)
+    if last is not None and last[0] == string:
+        return last[1]
+    words = tuple(_Word(span=word.span, value=word.value.lower()) for word in iter_words(string))
+    _last_lower_words.value = (string, words)
+    return words
 
 
 # list of common words which could be interpreted as properties, but which
@@ -61,28 +61,53 @@ class EquivalentHoles(Rule):
     priority = POST_PROCESS
     consequence = AppendMatch
 
+    @staticmethod
+    def _equivalent_index(matches):
+        """
+        Index string matches that can be equivalent to holes by their lowercased value.
+        :param matches:
+        :type matches: rebulk.match.Matches
+        :return: names, and for each lowercased value, list of (name, matches) in names order.
+        :rtype: tuple
+        """
+        names = list(matches.names)
+        index = {}
+        for name in names:
+            for current_match in matches.named(name):
+                if isinstance(current_match.value, six.string_types) and \
+                        'equivalent-ignore' not in current_match.tags:
+                    candidates = index.setdefault(current_match.value.lower(), [])
+                    if not candidates or candidates[-1][0] != name:
+                        candidates.append((name, []))
+                    candidates[-1][1].append(current_match)
+        return names, index
+
     def when(self, matches, context):
         new_matches = []
 
+        names, index = self._equivalent_index(matches)
+        if not index:
+            return new_matches
+
         for filepath in marker_sorted(matches.markers.named('path'), matches):
             holes = matches.holes(start=filepath.start, end=filepath.end, formatter=cleanup)
-            for name in matches.names:
-                for hole in list(holes):
-                    for current_match in matches.named(name):
-                        if isinstance(current_match.value, six.string_types) and \
-                                        hole.value.lower() == current_match.value.lower():
-                            if 'equivalent-ignore' in current_match.tags:
-                                continue
-                            new_value = _preferred_string(hole.value, current_match.value)
-                            if hole.value != new_value:
-                                hole.value = new_value
-                            if current_match.value != new_value:
-                                current_match.value = new_value
-                            hole.name = name
-                            hole.tags = ['equivalent']
-                            new_matches.append(hole)
-                            if hole in holes:
-                                holes.remove(hole)
+            equivalent_holes = defaultdict(list)
+            for hole in holes:
+                candidates = index.get(hole.value.lower())
+                if not candidates:
+                    continue
+                name, current_matches = candidates[0]
+                for current_match in current_matches:
+                    new_value = _preferred_string(hole.value, current_match.value)
+                    if hole.value != new_value:
+                        hole.value = new_value
+                    if current_match.value != new_value:
+                        current_match.value = new_value
+                    hole.name = name
+                    hole.tags = ['equivalent']
+                    equivalent_holes[name].append(hole)
+            for name in names:
+                new_matches.extend(equivalent_holes.get(name, ()))
 
         return new_matches
 
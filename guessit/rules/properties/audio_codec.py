@@ -7,6 +7,7 @@ from rebulk.remodule import re
 
 from rebulk import Rebulk, Rule, RemoveMatch
 from ..common import dash
+from ..common.named import range_named
 from ..common.validators import seps_before, seps_after
 
 audio_properties = ['audio_codec', 'audio_profile', 'audio_channels']
@@ -78,7 +79,7 @@ class AudioValidatorRule(Rule):
     def when(self, matches, context):
         ret = []
 
-        audio_list = matches.range(predicate=lambda match: match.name in audio_properties)
+        audio_list = range_named(matches, 0, None, audio_properties)
         for audio in audio_list:
             if not seps_before(audio):
                 valid_before = matches.range(audio.start - 1, audio.start,
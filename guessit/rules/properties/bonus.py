@@ -9,6 +9,7 @@ from rebulk import Rebulk, AppendMatch, Rule
 
 from .title import TitleFromPosition
 from ..common.formatters import cleanup
+from ..common.named import at_match_named
 from ..common.validators import seps_surround
 
 
@@ -43,7 +44,7 @@ class BonusTitleRule(Rule):
     def when(self, matches, context):
         bonus_number = matches.named('bonus', lambda match: not match.private, index=0)
         if bonus_number:
-            filepath = matches.markers.at_match(bonus_number, lambda marker: marker.name == 'path', 0)
+            filepath = at_match_named(matches.markers, bonus_number, 'path', 0)
             hole = matches.holes(bonus_number.end, filepath.end + 1, formatter=cleanup, index=0)
             if hole and hole.value:
                 hole.name = 'bonus_title'
@@ -7,7 +7,8 @@ country property
 import babelfish
 
 from rebulk import Rebulk
-from ..common.words import COMMON_WORDS, iter_words
+from ..common.words import COMMON_WORDS, lower_words
+from ...cache import InternTable
 
 
 def country():
@@ -21,14 +22,17 @@ def country():
     rebulk.functional(find_countries,
                       #  Prefer language and any other property over country if not US or GB.
                       conflict_solver=lambda match, other: match
-                      if other.name != 'language' or match.value not in [babelfish.Country('US'),
-                                                                         babelfish.Country('GB')]
+                      if other.name != 'language' or match.value not in _preferred_countries
                       else other,
                       properties={'country': [None]})
 
     return rebulk
 
 
+intern_country = InternTable(babelfish.Country)  # Shared Country instances, by alpha2
+
+_preferred_countries = [intern_country('US'), intern_country('GB')]
+
 COUNTRIES_SYN = {'ES': ['españa'],
                  'GB': ['UK'],
                  'BR': ['brazilian', 'bra'],
@@ -44,6 +48,7 @@ class GuessitCountryConverter(babelfish.CountryReverseConverter):  # pylint: dis
         for alpha2, synlist in COUNTRIES_SYN.items():
             for syn in synlist:
                 self.guessit_exceptions[syn.lower()] = alpha2
+        self._words = None
 
     @property
     def codes(self):  # pylint: disable=missing-docstring
@@ -51,6 +56,26 @@ class GuessitCountryConverter(babelfish.CountryReverseConverter):  # pylint: dis
                 frozenset(babelfish.COUNTRIES.values()) |
                 frozenset(self.guessit_exceptions.keys()))
 
+    @property
+    def words(self):
+        """
+        Dict of all lowercase words that can be reversed, to their reversed alpha2 code.
+
+        It's built on first access, so looking up a word is a single dict access instead of trying each
+        babelfish converter.
+        """
+        if self._words is None:
+            words = {}
+            for code in self.codes | frozenset(babelfish.COUNTRIES.keys()):
+                word = code.lower()
+                if word not in words:
+                    try:
+                        words[word] = self.reverse(word)
+                    except babelfish.Error:
+                        pass
+            self._words = words
+        return self._words
+
     def convert(self, alpha2):
         if alpha2 == 'GB':
             return 'UK'
@@ -78,7 +103,8 @@ class GuessitCountryConverter(babelfish.CountryReverseConverter):  # pylint: dis
         raise babelfish.CountryReverseError(name)
 
 
-babelfish.country_converters['guessit'] = GuessitCountryConverter()
+guessit_country_converter = GuessitCountryConverter()
+babelfish.country_converters['guessit'] = guessit_country_converter
 
 
 def is_allowed_country(country_object, context=None):
@@ -96,12 +122,15 @@ def find_countries(string, context=None):
     Find countries in given string.
     """
     ret = []
-    for word_match in iter_words(string.strip().lower()):
+    for word_match in lower_words(string):
         word = word_match.value
-        if word.lower() in COMMON_WORDS:
+        if word in COMMON_WORDS:
+            continue
+        alpha2 = guessit_country_converter.words.get(word)
+        if alpha2 is None:
             continue
         try:
-            country_object = babelfish.Country.fromguessit(word)
+            country_object = intern_country(alpha2)
             if is_allowed_country(country_object, context):
                 ret.append((word_match.span[0], word_match.span[1], {'value': country_object}))
         except babelfish.Error:
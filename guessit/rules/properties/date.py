@@ -6,6 +6,7 @@ date and year properties
 from rebulk import Rebulk, RemoveMatch, Rule
 
 from ..common.date import search_date, valid_year
+from ..common.named import range_named, at_match_named
 from ..common.validators import seps_surround
 
 
@@ -53,12 +54,12 @@ class KeepMarkedYearInFilepart(Rule):
         ret = []
         if len(matches.named('year')) > 1:
             for filepart in matches.markers.named('path'):
-                years = matches.range(filepart.start, filepart.end, lambda match: match.name == 'year')
+                years = range_named(matches, filepart.start, filepart.end, 'year')
                 if len(years) > 1:
                     group_years = []
                     ungroup_years = []
                     for year in years:
-                        if matches.markers.at_match(year, lambda marker: marker.name == 'group'):
+                        if at_match_named(matches.markers, year, 'group'):
                             group_years.append(year)
                         else:
                             ungroup_years.append(year)
@@ -9,6 +9,7 @@ from rebulk import Rebulk, Rule, AppendMatch, RenameMatch
 from ..common import seps, title_seps
 from ..properties.title import TitleFromPosition, TitleBaseRule
 from ..common.formatters import cleanup
+from ..common.named import range_named, previous_named
 
 
 def episode_title():
@@ -44,7 +45,7 @@ class TitleToEpisodeTitle(Rule):
         episode_titles = []
         main_titles = []
         for title in titles:
-            if matches.previous(title, lambda match: match.name == 'episode'):
+            if previous_named(matches, title, 'episode'):
                 episode_titles.append(title)
             else:
                 main_titles.append(title)
@@ -80,7 +81,7 @@ class EpisodeTitleFromPosition(TitleBaseRule):
 
     def filepart_filter(self, filepart, matches):
         # Filepart where title was found.
-        if matches.range(filepart.start, filepart.end, lambda match: match.name == 'title'):
+        if range_named(matches, filepart.start, filepart.end, 'title'):
             return True
         return False
 
@@ -109,7 +110,7 @@ class AlternativeTitleReplace(Rule):
         if matches.named('episode_title'):
             return
 
-        alternative_title = matches.range(predicate=lambda match: match.name == 'alternative_title', index=0)
+        alternative_title = range_named(matches, 0, None, 'alternative_title', 0)
         if alternative_title:
             main_title = matches.chain_before(alternative_title.start, seps=seps,
                                               predicate=lambda match: 'title' in match.tags, index=0)
@@ -154,9 +155,9 @@ class Filepart3EpisodeTitle(Rule):
         directory = fileparts[-2]
         subdirectory = fileparts[-3]
 
-        episode_number = matches.range(filename.start, filename.end, lambda match: match.name == 'episode', 0)
+        episode_number = range_named(matches, filename.start, filename.end, 'episode', 0)
         if episode_number:
-            season = matches.range(directory.start, directory.end, lambda match: match.name == 'season', 0)
+            season = range_named(matches, directory.start, directory.end, 'season', 0)
 
             if season:
                 hole = matches.holes(subdirectory.start, subdirectory.end,
@@ -186,9 +187,9 @@ class Filepart2EpisodeTitle(Rule):
         filename = fileparts[-1]
         directory = fileparts[-2]
 
-        episode_number = matches.range(filename.start, filename.end, lambda match: match.name == 'episode', 0)
+        episode_number = range_named(matches, filename.start, filename.end, 'episode', 0)
         if episode_number:
-            season = matches.range(directory.start, directory.end, lambda match: match.name == 'season', 0)
+            season = range_named(matches, directory.start, directory.end, 'season', 0)
             if season:
                 hole = matches.holes(directory.start, directory.end, formatter=cleanup, seps=title_seps,
                                      predicate=lambda match: match.value, index=0)
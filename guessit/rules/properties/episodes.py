@@ -14,6 +14,7 @@ from rebulk.utils import is_iterable
 from .title import TitleFromPosition
 from ..common import dash, alt_dash, seps
 from ..common.formatters import strip
+from ..common.named import range_named, range_tagged, previous_named, next_named, at_match_named
 from ..common.numeral import numeral, parse_numeral
 from ..common.validators import compose, seps_surround, seps_before, int_coercable
 from ...reutils import build_or_pattern
@@ -325,7 +326,7 @@ class CountValidator(Rule):
         season_count = []
 
         for count in matches.named('count'):
-            previous = matches.previous(count, lambda match: match.name in ['episode', 'season'], 0)
+            previous = previous_named(matches, count, ['episode', 'season'], 0)
             if previous:
                 if previous.name == 'episode':
                     episode_count.append(count)
@@ -353,8 +354,8 @@ class AbstractSeparatorRange(Rule):
         to_append = []
 
         for separator in matches.named(self.property_name + 'Separator'):
-            previous_match = matches.previous(separator, lambda match: match.name == self.property_name, 0)
-            next_match = matches.next(separator, lambda match: match.name == self.property_name, 0)
+            previous_match = previous_named(matches, separator, self.property_name, 0)
+            next_match = next_named(matches, separator, self.property_name, 0)
 
             if previous_match and next_match and separator.value in self.range_separators:
                 for episode_number in range(previous_match.value + 1, next_match.value):
@@ -430,10 +431,8 @@ class RemoveWeakIfSxxExx(Rule):
     def when(self, matches, context):
         to_remove = []
         for filepart in matches.markers.named('path'):
-            if matches.range(filepart.start, filepart.end,
-                             predicate=lambda match: not match.private and 'SxxExx' in match.tags):
-                to_remove.extend(matches.range(
-                    filepart.start, filepart.end, predicate=lambda match: 'weak-movie' in match.tags))
+            if any(not match.private for match in range_tagged(matches, filepart.start, filepart.end, 'SxxExx')):
+                to_remove.extend(range_tagged(matches, filepart.start, filepart.end, 'weak-movie'))
         return to_remove
 
 
@@ -468,8 +467,8 @@ class EpisodeDetailValidator(Rule):
         ret = []
         for detail in matches.named('episode_details'):
             if not seps_surround(detail) \
-                    and not matches.previous(detail, lambda match: match.name in ['season', 'episode']) \
-                    and not matches.next(detail, lambda match: match.name in ['season', 'episode']):
+                    and not previous_named(matches, detail, ['season', 'episode']) \
+                    and not next_named(matches, detail, ['season', 'episode']):
                 ret.append(detail)
         return ret
 
@@ -516,7 +515,7 @@ class VersionValidator(Rule):
     def when(self, matches, context):
         ret = []
         for version in matches.named('version'):
-            episode_number = matches.previous(version, lambda match: match.name == 'episode', 0)
+            episode_number = previous_named(matches, version, 'episode', 0)
             if not episode_number and not seps_surround(version.initiator):
                 ret.append(version)
         return ret
@@ -533,8 +532,8 @@ class EpisodeSingleDigitValidator(Rule):
     def when(self, matches, context):
         ret = []
         for episode in matches.named('episode', lambda match: len(match.initiator) == 1):
-            group = matches.markers.at_match(episode, lambda marker: marker.name == 'group', index=0)
+            group = at_match_named(matches.markers, episode, 'group', 0)
             if group:
-                if not matches.range(*group.span, predicate=lambda match: match.name == 'title'):
+                if not range_named(matches, group.start, group.end, 'title'):
                     ret.append(episode)
         return ret
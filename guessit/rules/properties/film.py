@@ -8,6 +8,7 @@ from rebulk import Rebulk, AppendMatch, Rule
 from rebulk.remodule import re
 
 from ..common.formatters import cleanup
+from ..common.named import at_match_named
 
 
 def film():
@@ -36,7 +37,7 @@ class FilmTitleRule(Rule):
     def when(self, matches, context):
         bonus_number = matches.named('film', lambda match: not match.private, index=0)
         if bonus_number:
-            filepath = matches.markers.at_match(bonus_number, lambda marker: marker.name == 'path', 0)
+            filepath = at_match_named(matches.markers, bonus_number, 'path', 0)
             hole = matches.holes(filepath.start, bonus_number.start + 1, formatter=cleanup, index=0)
             if hole and hole.value:
                 hole.name = 'film_title'
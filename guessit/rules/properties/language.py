@@ -10,7 +10,9 @@ import babelfish
 
 from rebulk.remodule import re
 from rebulk import Rebulk, Rule, RemoveMatch, RenameMatch
-from ..common.words import iter_words, COMMON_WORDS
+from ..common.words import lower_words, COMMON_WORDS
+from ...cache import InternTable
+from ..common.named import previous_named, next_named, at_match_named
 from ..common.validators import seps_surround
 
 
@@ -34,7 +36,9 @@ def language():
 
 COMMON_WORDS_STRICT = frozenset(['brazil'])
 
-UNDETERMINED = babelfish.Language('und')
+intern_language = InternTable(babelfish.Language)  # Shared Language instances, by (alpha3, country, script)
+
+UNDETERMINED = intern_language('und', None, None)
 
 SYN = {('und', None): ['unknown', 'inconnu', 'unk', 'un'],
        ('ell', None): ['gr', 'greek'],
@@ -60,6 +64,7 @@ class GuessitConverter(babelfish.LanguageReverseConverter):  # pylint: disable=m
         for (alpha3, country), synlist in SYN.items():
             for syn in synlist:
                 self.guessit_exceptions[syn.lower()] = (alpha3, country, None)
+        self._words = None
 
     @property
     def codes(self):  # pylint: disable=missing-docstring
@@ -70,6 +75,35 @@ class GuessitConverter(babelfish.LanguageReverseConverter):  # pylint: disable=m
                 babelfish.country_converters['name'].codes |
                 frozenset(self.guessit_exceptions.keys()))
 
+    @property
+    def words(self):
+        """
+        Dict of all lowercase words that can be reversed, to their reversed (alpha3, country, script) tuple.
+
+        Words with a country, like "pt-br", are not handled, as they can't be found by words tokenizer.
+
+        It's built on first access, so looking up a word is a single dict access instead of trying each
+        babelfish converter.
+        """
+        if self._words is None:
+            words = {}
+            # Same precedence as reverse method, lowest first so that higher precedence codes override them.
+            for name in ['opensubtitles', 'name', 'alpha2', 'alpha3b']:
+                converter = babelfish.language_converters[name]
+                for code in converter.codes:
+                    word = code.lower()
+                    try:
+                        reverse = converter.reverse(word)
+                    except babelfish.LanguageReverseError:
+                        continue
+                    if reverse[0] in babelfish.LANGUAGES:
+                        words[word] = (tuple(reverse) + (None, None))[:3]
+            for alpha3 in babelfish.LANGUAGES:
+                words[alpha3] = (alpha3, None, None)
+            words.update(self.guessit_exceptions)
+            self._words = words
+        return self._words
+
     def convert(self, alpha3, country=None, script=None):
         return str(babelfish.Language(alpha3, country, script))
 
@@ -104,7 +138,8 @@ class GuessitConverter(babelfish.LanguageReverseConverter):  # pylint: disable=m
         raise babelfish.LanguageReverseError(name)
 
 
-babelfish.language_converters['guessit'] = GuessitConverter()
+guessit_converter = GuessitConverter()
+babelfish.language_converters['guessit'] = guessit_converter
 
 subtitle_both = ['sub', 'subs', 'subbed', 'custom subbed', 'custom subs', 'custom sub', 'customsubbed', 'customsubs',
                  'customsub']
@@ -112,38 +147,59 @@ subtitle_prefixes = subtitle_both + ['st', 'vost', 'subforced', 'fansub', 'hards
 subtitle_suffixes = subtitle_both + ['subforced', 'fansub', 'hardsub']
 lang_prefixes = ['true']
 
-all_lang_prefixes_suffixes = subtitle_prefixes + subtitle_suffixes + lang_prefixes
+# Tuples allow to check all prefixes/suffixes at once with str.startswith/str.endswith
+_subtitle_prefixes = tuple(subtitle_prefixes)
+_subtitle_suffixes = tuple(subtitle_suffixes)
+_lang_prefixes = tuple(lang_prefixes)
 
+all_lang_prefixes_suffixes = subtitle_prefixes + subtitle_suffixes + lang_prefixes
 
-def find_languages(string, context=None):
-    """Find languages in the string
 
-    :return: list of tuple (property, Language, lang_word, word)
+def _strip_affixes(word):
     """
-    allowed_languages = context.get('allowed_languages')
-    common_words = COMMON_WORDS_STRICT if allowed_languages else COMMON_WORDS
+    Remove subtitle and language prefixes and suffixes from a lowercase word.
 
-    matches = []
-    for word_match in iter_words(string):
-        word = word_match.value
-        start, end = word_match.span
-
-        lang_word = word.lower()
-        key = 'language'
+    :return: tuple (lang_word, property name)
+    """
+    lang_word = word
+    key = 'language'
+    if lang_word.startswith(_subtitle_prefixes):
         for prefix in subtitle_prefixes:
             if lang_word.startswith(prefix):
                 lang_word = lang_word[len(prefix):]
                 key = 'subtitle_language'
+    if lang_word.endswith(_subtitle_suffixes):
         for suffix in subtitle_suffixes:
             if lang_word.endswith(suffix):
                 lang_word = lang_word[:len(lang_word) - len(suffix)]
                 key = 'subtitle_language'
+    if lang_word.startswith(_lang_prefixes):
         for prefix in lang_prefixes:
             if lang_word.startswith(prefix):
                 lang_word = lang_word[len(prefix):]
-        if lang_word not in common_words and word.lower() not in common_words:
+    return lang_word, key
+
+
+def find_languages(string, context=None):
+    """Find languages in the string
+
+    :return: list of tuple (property, Language, lang_word, word)
+    """
+    allowed_languages = context.get('allowed_languages')
+    common_words = COMMON_WORDS_STRICT if allowed_languages else COMMON_WORDS
+
+    matches = []
+    for word_match in lower_words(string):
+        word = word_match.value
+        start, end = word_match.span
+
+        lang_word, key = _strip_affixes(word)
+        if lang_word not in common_words and word not in common_words:
+            reverse = guessit_converter.words.get(lang_word)
+            if reverse is None:
+                continue
             try:
-                lang = babelfish.Language.fromguessit(lang_word)
+                lang = intern_language(*reverse)
                 match = (start, end, {'name': key, 'value': lang})
                 if allowed_languages:
                     if lang.name.lower() in allowed_languages \
@@ -171,13 +227,12 @@ class SubtitlePrefixLanguageRule(Rule):
         to_rename = []
         to_remove = matches.named('subtitle_language.prefix')
         for lang in matches.named('language'):
-            prefix = matches.previous(lang, lambda match: match.name == 'subtitle_language.prefix', 0)
+            prefix = previous_named(matches, lang, 'subtitle_language.prefix', 0)
             if not prefix:
-                group_marker = matches.markers.at_match(lang, lambda marker: marker.name == 'group', 0)
+                group_marker = at_match_named(matches.markers, lang, 'group', 0)
                 if group_marker:
                     # Find prefix if placed just before the group
-                    prefix = matches.previous(group_marker, lambda match: match.name == 'subtitle_language.prefix',
-                                              0)
+                    prefix = previous_named(matches, group_marker, 'subtitle_language.prefix', 0)
                     if not prefix:
                         # Find prefix if placed before in the group
                         prefix = matches.range(group_marker.start, lang.start,
@@ -215,7 +270,7 @@ class SubtitleSuffixLanguageRule(Rule):
         to_append = []
         to_remove = matches.named('subtitle_language.suffix')
         for lang in matches.named('language'):
-            suffix = matches.next(lang, lambda match: match.name == 'subtitle_language.suffix', 0)
+            suffix = next_named(matches, lang, 'subtitle_language.suffix', 0)
             if suffix:
                 to_append.append(lang)
                 if suffix in to_remove:
@@ -244,6 +299,6 @@ class SubtitleExtensionRule(Rule):
                                            lambda match: 'extension' in match.tags and 'subtitle' in match.tags,
                                            0)
         if subtitle_extension:
-            subtitle_lang = matches.previous(subtitle_extension, lambda match: match.name == 'language', 0)
+            subtitle_lang = previous_named(matches, subtitle_extension, 'language', 0)
             if subtitle_lang:
                 return subtitle_lang
@@ -3,11 +3,10 @@
 """
 mimetype property
 """
-import mimetypes
-
 from rebulk import Rebulk, CustomRule, POST_PROCESS
 from rebulk.match import Match
 
+from ...rules.common import property_disabled
 from ...rules.processors import Processors
 
 
@@ -17,7 +16,7 @@ def mimetype():
     :return: Created Rebulk object
     :rtype: Rebulk
     """
-    return Rebulk().rules(Mimetype)
+    return Rebulk(disabled=lambda context: property_disabled(context, 'mimetype')).rules(Mimetype)
 
 
 class Mimetype(CustomRule):
@@ -33,6 +32,7 @@ class Mimetype(CustomRule):
     dependency = Processors
 
     def when(self, matches, context):
+        import mimetypes  # lazy import, as mimetypes module loads system files
         mime, _ = mimetypes.guess_type(matches.input_string, strict=False)
         return mime
 
@@ -9,7 +9,8 @@ from rebulk import Rebulk, Rule, RemoveMatch, POST_PROCESS, AppendMatch
 from rebulk.remodule import re
 
 from ..common import dash
-from ..common import seps
+from ..common import seps, property_disabled
+from ..common.named import previous_named, next_named
 from ..common.validators import seps_surround, compose
 from ...reutils import build_or_pattern
 from ...rules.common.formatters import raw_cleanup
@@ -91,6 +92,9 @@ class ProperCountRule(Rule):
 
     properties = {'proper_count': [None]}
 
+    def enabled(self, context):
+        return not property_disabled(context, 'proper_count')
+
     def when(self, matches, context):
         propers = matches.named('other', lambda match: match.value == 'Proper')
         if propers:
@@ -113,13 +117,13 @@ class ValidateHasNeighbor(Rule):
         ret = []
         for to_check in matches.range(predicate=lambda match: 'has-neighbor' in match.tags):
             previous_match = matches.previous(to_check, index=0)
-            previous_group = matches.markers.previous(to_check, lambda marker: marker.name == 'group', 0)
+            previous_group = previous_named(matches.markers, to_check, 'group', 0)
             if previous_group and (not previous_match or previous_group.end > previous_match.end):
                 previous_match = previous_group
             if previous_match and not matches.input_string[previous_match.end:to_check.start].strip(seps):
                 break
             next_match = matches.next(to_check, index=0)
-            next_group = matches.markers.next(to_check, lambda marker: marker.name == 'group', 0)
+            next_group = next_named(matches.markers, to_check, 'group', 0)
             if next_group and (not next_match or next_group.start < next_match.start):
                 next_match = next_group
             if next_match and not matches.input_string[to_check.end:next_match.start].strip(seps):
@@ -138,7 +142,7 @@ class ValidateHasNeighborBefore(Rule):
         ret = []
         for to_check in matches.range(predicate=lambda match: 'has-neighbor-before' in match.tags):
             next_match = matches.next(to_check, index=0)
-            next_group = matches.markers.next(to_check, lambda marker: marker.name == 'group', 0)
+            next_group = next_named(matches.markers, to_check, 'group', 0)
             if next_group and (not next_match or next_group.start < next_match.start):
                 next_match = next_group
             if next_match and not matches.input_string[to_check.end:next_match.start].strip(seps):
@@ -157,7 +161,7 @@ class ValidateHasNeighborAfter(Rule):
         ret = []
         for to_check in matches.range(predicate=lambda match: 'has-neighbor-after' in match.tags):
             previous_match = matches.previous(to_check, index=0)
-            previous_group = matches.markers.previous(to_check, lambda marker: marker.name == 'group', 0)
+            previous_group = previous_named(matches.markers, to_check, 'group', 0)
             if previous_group and (not previous_match or previous_group.end > previous_match.end):
                 previous_match = previous_group
             if previous_match and not matches.input_string[previous_match.end:to_check.start].strip(seps):
@@ -176,7 +180,7 @@ class ValidateScreenerRule(Rule):
     def when(self, matches, context):
         ret = []
         for screener in matches.named('other', lambda match: 'other.validate.screener' in match.tags):
-            format_match = matches.previous(screener, lambda match: match.name == 'format', 0)
+            format_match = previous_named(matches, screener, 'format', 0)
             if not format_match or matches.input_string[format_match.end:screener.start].strip(seps):
                 ret.append(screener)
         return ret
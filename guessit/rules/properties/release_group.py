@@ -6,9 +6,9 @@ release_group property
 import copy
 
 from rebulk import Rebulk, Rule, AppendMatch
-from rebulk.remodule import re
 
-from ..common import seps, dash
+from ..common import seps
+from ..common.expected import expected_rebulk
 from ..common.comparators import marker_sorted
 from ..common.formatters import cleanup
 from ..common.validators import int_coercable
@@ -71,18 +71,7 @@ class ExpectedReleaseGroup(Rule):
         return context.get('expected_group')
 
     def when(self, matches, context):
-        expected_rebulk = Rebulk().defaults(name='release_group')
-
-        for expected_group in context.get('expected_group'):
-            if expected_group.startswith('re:'):
-                expected_group = expected_group[3:]
-                expected_group = expected_group.replace(' ', '-')
-                expected_rebulk.regex(expected_group, abbreviations=[dash], flags=re.IGNORECASE)
-            else:
-                expected_rebulk.string(expected_group, ignore_case=True)
-
-        matches = expected_rebulk.matches(matches.input_string, context)
-        return matches
+        return expected_rebulk(context.get('expected_group'), 'release_group').matches(matches.input_string, context)
 
 
 class SceneReleaseGroup(Rule):
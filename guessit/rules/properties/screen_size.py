@@ -8,6 +8,7 @@ from rebulk.remodule import re
 from rebulk import Rebulk, Rule, RemoveMatch
 from ..common.validators import seps_surround
 from ..common import dash
+from ..common.named import range_named
 
 
 def screen_size():
@@ -69,8 +70,7 @@ class ScreenSizeOnlyOne(Rule):
     def when(self, matches, context):
         to_remove = []
         for filepart in matches.markers.named('path'):
-            screensize = list(reversed(matches.range(filepart.start, filepart.end,
-                                                     lambda match: match.name == 'screen_size')))
+            screensize = list(reversed(range_named(matches, filepart.start, filepart.end, 'screen_size')))
             if len(screensize) > 1:
                 to_remove.extend(screensize[1:])
 
@@ -9,6 +9,7 @@ from rebulk import Rebulk
 from rebulk.rules import Rule, RemoveMatch
 
 from ...rules.common import seps, dash
+from ...rules.common.named import next_named
 from ...rules.common.validators import seps_surround
 
 
@@ -81,7 +82,7 @@ class ValidateStreamingService(Rule):
         """
         to_remove = []
         for service in matches.named('streaming_service'):
-            next_match = matches.next(service, predicate=lambda match: match.name == 'format', index=0)
+            next_match = next_named(matches, service, 'format', 0)
             if next_match and not matches.holes(service.end, next_match.start,
                                                 predicate=lambda match: match.value.strip(seps)):
                 if service.value == 'Comedy Central':
@@ -3,18 +3,16 @@
 """
 title property
 """
-import re
-
 from rebulk import Rebulk, Rule, AppendMatch, RemoveMatch, AppendTags
 from rebulk.formatters import formatters
-from rebulk.pattern import RePattern
-from rebulk.utils import find_all
 
 from .film import FilmTitleRule
 from .language import SubtitlePrefixLanguageRule, SubtitleSuffixLanguageRule, SubtitleExtensionRule
 from ..common.formatters import cleanup, reorder_title
 from ..common.comparators import marker_sorted
-from ..common import seps, title_seps, dash
+from ..common.expected import expected_matcher
+from ..common.named import range_named, at_match_named
+from ..common import seps, title_seps
 
 
 def title():
@@ -35,20 +33,7 @@ def title():
         :return:
         :rtype:
         """
-        ret = []
-        for search in context.get('expected_title'):
-            if search.startswith('re:'):
-                search = search[3:]
-                search = search.replace(' ', '-')
-                matches = RePattern(search, abbreviations=[dash], flags=re.IGNORECASE).matches(input_string, context)
-                for match in matches:
-                    # Instance of 'list' has no 'span' member (no-member). Seems to be a pylint bug.
-                    # pylint: disable=no-member
-                    ret.append(match.span)
-            else:
-                for start in find_all(input_string, search, ignore_case=True):
-                    ret.append((start, start+len(search)))
-        return ret
+        return expected_matcher(context.get('expected_title')).spans(input_string)
 
     rebulk.functional(expected_title, name='title', tags=['expected'],
                       conflict_solver=lambda match, other: other,
@@ -264,7 +249,7 @@ class TitleBaseRule(Rule):
         # Priorize fileparts containing the year
         years_fileparts = []
         for filepart in fileparts:
-            year_match = matches.range(filepart.start, filepart.end, lambda match: match.name == 'year', 0)
+            year_match = range_named(matches, filepart.start, filepart.end, 'year', 0)
             if year_match:
                 years_fileparts.append(filepart)
 
@@ -320,11 +305,11 @@ class PreferTitleWithYear(Rule):
         titles = matches.named('title')
 
         for title_match in titles:
-            filepart = matches.markers.at_match(title_match, lambda marker: marker.name == 'path', 0)
+            filepart = at_match_named(matches.markers, title_match, 'path', 0)
             if filepart:
-                year_match = matches.range(filepart.start, filepart.end, lambda match: match.name == 'year', 0)
+                year_match = range_named(matches, filepart.start, filepart.end, 'year', 0)
                 if year_match:
-                    group = matches.markers.at_match(year_match, lambda group: group.name == 'group')
+                    group = at_match_named(matches.markers, year_match, 'group')
                     if group:
                         with_year_in_group.append(title_match)
                     else:
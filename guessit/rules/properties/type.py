@@ -6,6 +6,7 @@ type property
 from rebulk import CustomRule, Rebulk, POST_PROCESS
 from rebulk.match import Match
 
+from ...rules.common import property_disabled
 from ...rules.processors import Processors
 
 
@@ -25,7 +26,7 @@ def type_():
     :return: Created Rebulk object
     :rtype: Rebulk
     """
-    return Rebulk().rules(TypeProcessor)
+    return Rebulk(disabled=lambda context: property_disabled(context, 'type')).rules(TypeProcessor)
 
 
 class TypeProcessor(CustomRule):
@@ -9,6 +9,7 @@ from rebulk import Rebulk, Rule, RemoveMatch
 
 from guessit.rules.common.validators import seps_after, seps_before
 from ..common import dash
+from ..common.named import previous_named, next_named
 from ..common.validators import seps_surround
 
 
@@ -79,9 +80,9 @@ class VideoProfileRule(Rule):
         profile_list = matches.named('video_profile', lambda match: 'video_profile.rule' in match.tags)
         ret = []
         for profile in profile_list:
-            codec = matches.previous(profile, lambda match: match.name == 'video_codec')
+            codec = previous_named(matches, profile, 'video_codec')
             if not codec:
-                codec = matches.next(profile, lambda match: match.name == 'video_codec')
+                codec = next_named(matches, profile, 'video_codec')
             if not codec:
                 ret.append(profile)
         return ret
@@ -3,11 +3,30 @@
 """
 Website property.
 """
-from pkg_resources import resource_stream  # @UnresolvedImport
+import pkgutil
+
 from rebulk.remodule import re
 
 from rebulk import Rebulk, Rule, RemoveMatch
-from ...reutils import build_or_pattern
+from ...reutils import build_or_pattern, build_trie_pattern
+
+_tlds = None  # pylint:disable=invalid-name
+
+
+def load_tlds():
+    """
+    All registered domain extensions, loaded once at first call.
+
+    The list is built before being assigned, so concurrent first calls never see it partially filled.
+    :return:
+    :rtype: list[str]
+    """
+    global _tlds  # pylint:disable=global-statement,invalid-name
+    if _tlds is None:
+        _tlds = [l.strip().decode('utf-8')
+                 for l in pkgutil.get_data('guessit', 'tlds-alpha-by-domain.txt').splitlines()[1:]
+                 if b'--' not in l]
+    return _tlds
 
 
 def website():
@@ -19,16 +38,15 @@ def website():
     rebulk = Rebulk().regex_defaults(flags=re.IGNORECASE)
     rebulk.defaults(name="website")
 
-    tlds = [l.strip().decode('utf-8')
-            for l in resource_stream('guessit', 'tlds-alpha-by-domain.txt').readlines()
-            if b'--' not in l][1:]  # All registered domain extension
+    tlds = load_tlds()
+    tlds_pattern = build_trie_pattern(tlds)  # Many tlds share the same prefix
 
     safe_tlds = ['com', 'org', 'net']  # For sure a website extension
     safe_subdomains = ['www']  # For sure a website subdomain
     safe_prefix = ['co', 'com', 'org', 'net']  # Those words before a tlds are sure
 
     rebulk.regex(r'(?:[^a-z0-9]|^)((?:'+build_or_pattern(safe_subdomains) +
-                 r'\.)+(?:[a-z-]+\.)+(?:'+build_or_pattern(tlds) +
+                 r'\.)+(?:[a-z-]+\.)+(?:'+tlds_pattern +
                  r'))(?:[^a-z0-9]|$)',
                  children=True)
     rebulk.regex(r'(?:[^a-z0-9]|^)((?:'+build_or_pattern(safe_subdomains) +
@@ -37,7 +55,7 @@ def website():
                  safe_subdomains=safe_subdomains, safe_tlds=safe_tlds, children=True)
     rebulk.regex(r'(?:[^a-z0-9]|^)((?:'+build_or_pattern(safe_subdomains) +
                  r'\.)*[a-z-]+\.(?:'+build_or_pattern(safe_prefix) +
-                 r'\.)+(?:'+build_or_pattern(tlds) +
+                 r'\.)+(?:'+tlds_pattern +
                  r'))(?:[^a-z0-9]|$)',
                  safe_subdomains=safe_subdomains, safe_prefix=safe_prefix, tlds=tlds, children=True)
 
@@ -0,0 +1,117 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# pylint: disable=no-self-use, pointless-statement, missing-docstring, invalid-name
+import asyncio
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+import threading
+
+import pytest
+
+from ..api import guessit, GuessitException, GuessItApi
+from ..aio import AsyncGuessItApi, guessit as aio_guessit, guessit_many as aio_guessit_many
+from ..cache import LRUCache
+
+strings = ['Fear.and.Loathing.in.Las.Vegas.FRENCH.ENGLISH.720p.HDDVD.DTS.x264-ESiR.mkv',
+           'Treme.1x03.Right.Place,.Wrong.Time.HDTV.XviD-NoTV.avi',
+           None,
+           'Movies/Fantastic Mr Fox/Fantastic.Mr.Fox.2009.DVDRip.{x264+LC-AAC.5.1}{Fr-Eng}{Sub.Fr-Eng}.mkv']
+
+
+class CountingExecutor(ThreadPoolExecutor):
+    def __init__(self, max_workers):
+        super(CountingExecutor, self).__init__(max_workers)
+        self.lock = threading.Lock()
+        self.submitted = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def submit(self, fn, *args, **kwargs):  # pylint:disable=arguments-differ
+        with self.lock:
+            self.submitted += 1
+
+        def counted():
+            with self.lock:
+                self.in_flight += 1
+                self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                with self.lock:
+                    self.in_flight -= 1
+
+        return super(CountingExecutor, self).submit(counted)
+
+
+def run(coroutine):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.close()
+
+
+def test_guessit():
+    ret = run(aio_guessit(strings[0], '-a'))
+    assert ret == guessit(strings[0], '-a')
+
+    with pytest.raises(GuessitException):
+        run(aio_guessit(None))
+
+
+def test_guessit_many():
+    results = run(aio_guessit_many(strings, '-a', chunksize=3))
+    assert [string for string, _ in results] == strings
+    assert isinstance(results[2][1], GuessitException)
+    for string, result in results[:2] + results[3:]:
+        assert result == guessit(string, '-a')
+
+
+def test_max_in_flight():
+    names = ['Show.Name.S01E%02d.720p.HDTV.x264-GRP.mkv' % i for i in range(1, 21)]
+    with CountingExecutor(8) as executor:
+        aio_api = AsyncGuessItApi(executor=executor, max_in_flight=2)
+        results = run(aio_api.guessit_many(names))
+    assert [result['episode'] for _, result in results] == list(range(1, 21))
+    assert executor.submitted == 20
+    assert executor.max_in_flight <= 2
+
+
+def test_pending_window():
+    names = ['Show.Name.S01E%02d.720p.HDTV.x264-GRP.mkv' % i for i in range(1, 21)]
+    aio_api = AsyncGuessItApi(max_in_flight=2)
+    run_chunk = aio_api._run  # pylint:disable=protected-access
+    counts = {'pending': 0, 'max': 0}
+
+    async def counted_run(chunk_strings, options):
+        counts['pending'] += 1
+        counts['max'] = max(counts['max'], counts['pending'])
+        try:
+            return await run_chunk(chunk_strings, options)
+        finally:
+            counts['pending'] -= 1
+
+    aio_api._run = counted_run  # pylint:disable=protected-access
+    results = run(aio_api.guessit_many(names))
+    assert [result['episode'] for _, result in results] == list(range(1, 21))
+    assert 0 < counts['max'] <= 4
+
+
+def test_cache():
+    with CountingExecutor(2) as executor:
+        aio_api = AsyncGuessItApi(GuessItApi(cache=LRUCache()), executor=executor)
+        ret = run(aio_api.guessit(strings[1]))
+        assert run(aio_api.guessit(strings[1])) == ret
+        assert executor.submitted == 1
+
+        ret['title'] = 'Altered'
+        assert run(aio_api.guessit(strings[1]))['title'] == 'Treme'
+
+
+def test_process_executor():
+    with ProcessPoolExecutor(2) as executor:
+        aio_api = AsyncGuessItApi(GuessItApi(cache=LRUCache()), executor=executor)
+        results = run(aio_api.guessit_many(strings, '-a', chunksize=2))
+        assert isinstance(results[2][1], GuessitException)
+        for string, result in results[:2] + results[3:]:
+            assert result == guessit(string, '-a')
+        assert len(aio_api.api.cache) == 3
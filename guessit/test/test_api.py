@@ -3,11 +3,20 @@
 # pylint: disable=no-self-use, pointless-statement, missing-docstring, invalid-name, pointless-string-statement
 
 import os
+import subprocess
+import sys
 
 import pytest
 import six
+from rebulk import Rebulk
+from rebulk.match import Match
 
-from ..api import guessit, properties, GuessitException
+from ..api import guessit, guessit_many, properties, GuessitException, GuessItApi
+from ..cache import LRUCache
+from ..options import GuessitOptions
+from ..rules import rebulk_builder
+from ..rules.properties.country import guessit_country_converter
+from ..rules.properties.language import guessit_converter
 
 __location__ = os.path.realpath(os.path.join(os.getcwd(), os.path.dirname(__file__)))
 
@@ -61,3 +70,166 @@ def test_exception():
     assert "An internal error has occured in guessit" in str(excinfo.value)
     assert "Guessit Exception Report" in str(excinfo.value)
     assert "Please report at https://github.com/guessit-io/guessit/issues" in str(excinfo.value)
+
+
+def test_cache():
+    api = GuessItApi(rebulk_builder(), cache=LRUCache(maxsize=10))
+    string = 'Fear.and.Loathing.in.Las.Vegas.FRENCH.ENGLISH.720p.HDDVD.DTS.x264-ESiR.mkv'
+
+    ret = api.guessit(string)
+    ret['title'] = 'Modified'
+    ret.matches.clear()
+
+    cached = api.guessit(string)
+    assert cached == guessit(string)
+    assert cached.matches['title']
+    assert api.cache.hits == 1 and api.cache.misses == 1
+
+    api.guessit(string, {'type': 'episode'})
+    assert api.cache.misses == 2
+
+    api.cache.clear()
+    api.guessit(string)
+    assert api.cache.misses == 3
+
+
+def test_guessit_many():
+    strings = ['Fear.and.Loathing.in.Las.Vegas.FRENCH.ENGLISH.720p.HDDVD.DTS.x264-ESiR.mkv',
+               object(),
+               'Series/dexter/Dexter.5x02.Hello,.Bandit.ENG.-.sub.FR.HDTV.XviD-AlFleNi-TeaM.[tvu.org.ru].avi']
+
+    results = list(guessit_many(iter(strings), {'type': 'episode'}))
+
+    assert [string for string, _ in results] == strings
+    assert results[0][1] == guessit(strings[0], {'type': 'episode'})
+    assert isinstance(results[1][1], GuessitException)
+    assert results[2][1] == guessit(strings[2], {'type': 'episode'})
+
+
+def test_guessit_options():
+    api = GuessItApi(rebulk_builder(), cache=LRUCache(maxsize=10))
+    string = 'Dexter.5x02.Hello,.Bandit.ENG.-.sub.FR.HDTV.XviD-AlFleNi-TeaM.avi'
+    options = GuessitOptions({'type': 'episode', 'expected_title': [u'Dexter']})
+
+    assert GuessItApi._prepare_options(options) is options  # pylint:disable=protected-access
+    assert GuessItApi._prepare_options('-t episode') is GuessItApi._prepare_options('-t episode')  # pylint:disable=protected-access
+    assert options.expected_title == ('Dexter',)
+    with pytest.raises(TypeError):
+        options['type'] = 'movie'  # pylint:disable=unsupported-assignment-operation
+
+    assert api.guessit(string, options) == guessit(string, {'type': 'episode', 'expected_title': ['Dexter']})
+    api.guessit(string, GuessitOptions({'expected_title': ['Dexter'], 'type': 'episode'}))
+    assert api.cache.hits == 1 and api.cache.misses == 1
+
+
+def test_pipelines(monkeypatch):
+    monkeypatch.setattr('guessit.api.pipelines_bypassed', lambda: False)
+    rebulk = rebulk_builder()
+    api = GuessItApi(rebulk, pipelines_maxsize=2)
+    no_pipelines_api = GuessItApi(rebulk, pipelines_maxsize=0)
+    string = 'Series/dexter/Dexter.5x02.Hello,.Bandit.ENG.-.sub.FR.HDTV.XviD-AlFleNi-TeaM.[tvu.org.ru].avi'
+
+    for options in ({}, {'type': 'episode'}, {'type': 'movie'}, {'episode_prefer_number': True}, {}):
+        assert api.guessit(string, options) == no_pipelines_api.guessit(string, options)
+    assert no_pipelines_api.pipelines is None
+    assert len(api.pipelines) == 2 and api.pipelines.evictions == 3
+
+    pipeline = api.pipeline(GuessitOptions({'type': 'episode'}))
+    assert pipeline is api.pipeline(GuessitOptions({'type': 'episode'}))
+    assert pipeline.patterns != api.pipeline(GuessitOptions({})).patterns
+
+
+def test_pipelines_unsupported(monkeypatch):
+    monkeypatch.setattr('guessit.pipeline.SUPPORTED', False)
+    api = GuessItApi(pipelines_maxsize=2)
+    string = 'Series/dexter/Dexter.5x02.Hello,.Bandit.ENG.-.sub.FR.HDTV.XviD-AlFleNi-TeaM.[tvu.org.ru].avi'
+    assert api.pipeline(GuessitOptions({})) is None
+    assert api.guessit(string) == guessit(string)
+
+
+def test_pipelines_rebulk_subclass():
+    class CustomRebulk(Rebulk):
+        def matches(self, string, context=None):
+            matches = super(CustomRebulk, self).matches(string, context)
+            matches.append(Match(0, 1, name='custom', input_string=string))
+            return matches
+
+    api = GuessItApi(CustomRebulk().string('custom'), pipelines_maxsize=2)
+    assert api.pipeline(GuessitOptions({})) is None
+    assert api.guessit('abc') == {'custom': 'a'}
+
+
+def test_pipelines_bypassed_when_logging(monkeypatch):
+    monkeypatch.setattr('guessit.api.pipelines_bypassed', lambda: True)
+    api = GuessItApi(pipelines_maxsize=2)
+    string = 'Series/dexter/Dexter.5x02.Hello,.Bandit.ENG.-.sub.FR.HDTV.XviD-AlFleNi-TeaM.[tvu.org.ru].avi'
+    assert api.guessit(string) == guessit(string)
+    assert len(api.pipelines) == 0
+
+
+def test_rebulk_setter_clears_cache():
+    api = GuessItApi(cache=LRUCache())
+    string = 'Fear.and.Loathing.in.Las.Vegas.FRENCH.ENGLISH.720p.HDDVD.DTS.x264-ESiR.mkv'
+    api.guessit(string)
+    api.pipeline(GuessitOptions({}))
+    assert len(api.cache) == 1 and len(api.pipelines) == 1
+
+    api.rebulk = rebulk_builder()
+    assert len(api.cache) == 0 and len(api.pipelines) == 0
+    assert api.guessit(string) == guessit(string)
+
+
+def test_expected_many():
+    string = 'Dexter.5x02.Hello,.Bandit.ENG.-.sub.FR.HDTV.XviD-AlFleNi-TeaM.avi'
+    expected_title = ['Show %i' % i for i in range(1000)] + ['re:Hel+o Bandit', 'Dexter']
+    expected_group = ['Group %i' % i for i in range(1000)] + ['AlFleNi-TeaM']
+
+    ret = guessit(string, {'expected_title': expected_title, 'expected_group': expected_group})
+    assert ret == guessit(string, {'expected_title': ['re:Hel+o Bandit', 'Dexter'], 'expected_group': ['AlFleNi-TeaM']})
+    assert ret['release_group'] == 'AlFleNi-TeaM'
+
+
+def test_only_properties():
+    string = 'Series/dexter/Dexter.5x02.Hello,.Bandit.PROPER.ENG.-.sub.FR.HDTV.XviD-AlFleNi-TeaM.[tvu.org.ru].avi'
+    ret = guessit(string)
+    assert 'mimetype' in ret and 'type' in ret and 'proper_count' in ret
+
+    for only_properties in (['title', 'year', 'season', 'episode'], ['release_group'], ['mimetype', 'type']):
+        only_ret = guessit(string, {'only_properties': only_properties})
+        assert only_ret == dict((key, value) for key, value in ret.items() if key in only_properties)
+
+    api = GuessItApi()
+    pipeline = api.pipeline(GuessitOptions({'only_properties': ['title']}))
+    assert len(pipeline.rules) == len(api.pipeline(GuessitOptions({})).rules) - 3
+
+
+def test_lazy_rebulk():
+    api = GuessItApi()
+    assert api._rebulk is None  # pylint:disable=protected-access
+
+    api.warmup()
+    rebulk = api.rebulk
+    assert rebulk is not None
+    assert api.rebulk is rebulk
+
+    ret = api.guessit('Fear.and.Loathing.in.Las.Vegas.FRENCH.ENGLISH.720p.HDDVD.DTS.x264-ESiR.mkv')
+    assert ret and 'title' in ret
+    assert api.rebulk is rebulk
+
+
+def test_warmup_builds_tables():
+    api = GuessItApi()
+    api.rebulk = rebulk_builder()
+    assert api.rebulk.keyword_index._compiled is None  # pylint:disable=protected-access
+
+    api.warmup()
+    assert api.rebulk.keyword_index._compiled is not None  # pylint:disable=protected-access
+    assert guessit_converter._words is not None  # pylint:disable=protected-access
+    assert guessit_country_converter._words is not None  # pylint:disable=protected-access
+
+
+def test_import_dependencies():
+    code = "import sys, guessit; print(','.join(sorted(set(sys.modules) & set(%r))))" % \
+           (['guessit.rules', 'babelfish', 'dateutil', 'pkg_resources', 'mimetypes'],)
+    output = subprocess.check_output([sys.executable, '-c', code])
+    assert not output.strip()
@@ -1,11 +1,45 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 # pylint: disable=no-self-use,pointless-statement,missing-docstring,invalid-name,line-too-long
-import time
+"""
+Benchmarks.
+
+Requires pytest-benchmark (test extra). Benchmarked functions are only ran once by default (see conftest.py), so
+they are checked like other tests, and corpus benchmarks are skipped. Run benchmarks for real, and save results as a
+baseline::
+
+    $ py.test guessit/test/test_benchmark.py --benchmark-enable --benchmark-save=baseline
+
+No baseline is committed, as timings depend on the machine: the first run above creates it in .benchmarks/.
+Then compare a later run to the last saved one, failing if mean time of any benchmark is 10% slower::
+
+    $ py.test guessit/test/test_benchmark.py --benchmark-enable --benchmark-compare --benchmark-compare-fail=mean:10%
+
+Corpus benchmarks store names count, names per second and percentiles of single guess duration in extra_info.
+"""
+# io.open supports encoding= in python 2.7
+from io import open  # pylint: disable=redefined-builtin
+import logging
+import os
+import re
+import subprocess
+import sys
+from timeit import default_timer
 
 import pytest
+import six
+import yaml
+
+from ..api import guessit, warmup
+from ..options import parse_options
+from ..rules.common.date import search_date
+from ..rules import rebulk_builder
+from ..yamlutils import OrderedDictYAMLLoader
+from . import test_yml
 
-from ..api import guessit
+pytest.importorskip('pytest_benchmark')
+
+__location__ = os.path.realpath(os.path.join(os.getcwd(), os.path.dirname(__file__)))
 
 
 def case1():
@@ -24,16 +58,96 @@ def case4():
     return guessit('Movies/The Doors (1991)/09.03.08.The.Doors.(1991).BDRip.720p.AC3.X264-HiS@SiLUHD-English.[sharethefiles.com].mkv')
 
 
+def cold_import():
+    return subprocess.check_call([sys.executable, '-c', 'import guessit'])
+
+
+def cold_start():
+    return subprocess.check_call([sys.executable, '-c', 'from guessit import guessit; '
+                                                        'guessit("Treme.1x03.Right.Place,.Wrong.Time.HDTV.XviD-NoTV.avi")'])
+
+
+def cold_rebulk_builder():
+    re.purge()  # Regular expressions are compiled again, like in a fresh interpreter.
+    return rebulk_builder()
+
+
+def load_corpus(filename):
+    """
+    Load strings and options of a yml test file.
+    """
+    with open(os.path.join(__location__, filename), 'r', encoding='utf-8') as infile:
+        data = yaml.load(infile, OrderedDictYAMLLoader)
+
+    last_expected = None
+    for string, expected in reversed(list(data.items())):
+        if expected is None:
+            data[string] = last_expected
+        else:
+            last_expected = expected
+
+    default = data.pop('__default__', None) or {}
+
+    corpus = []
+    for string, expected in data.items():
+        options = expected.get('options', default.get('options'))
+        options = dict(parse_options(options)) if options else {}
+        options.setdefault('implicit', True)
+        if six.PY2 and isinstance(string, six.text_type):
+            string = string.encode('utf-8')
+        if not isinstance(string, str):
+            string = str(string)
+        matches = test_yml.TestYml.options_re.search(string)
+        if matches:
+            string = matches.group(2)
+        corpus.append((string, options))
+    return corpus
+
+
+def guess_corpus(corpus, durations):
+    """
+    Guess all strings of corpus, appending each guess duration to durations.
+    """
+    for string, options in corpus:
+        start = default_timer()
+        guessit(string, options)
+        durations.append(default_timer() - start)
+
+
+def search_dates(corpus):
+    """
+    Search dates in all strings of corpus, like the date functional pattern does.
+    """
+    return [search_date(string, options.get('date_year_first'), options.get('date_day_first'))
+            for string, options in corpus]
+
+
+def percentile(sorted_values, percent):
+    return sorted_values[int(round(percent / 100.0 * (len(sorted_values) - 1)))]
+
+
+def corpus_stats(durations):
+    """
+    Names count, names per second and percentiles of single guess durations, in seconds.
+    """
+    durations = sorted(durations)
+    ret = {'names': len(durations), 'names_per_second': len(durations) / sum(durations)}
+    for percent in (50, 90, 99, 100):
+        ret['p%i' % percent] = percentile(durations, percent)
+    return ret
+
+
+corpus_files, corpus_ids = test_yml.files_and_ids()
+
+
 @pytest.mark.benchmark(
     group="Performance Tests",
     min_time=1,
     max_time=2,
     min_rounds=5,
-    timer=time.time,
     disable_gc=True,
     warmup=False
 )
-@pytest.mark.skipif(True, reason="Disabled")
 class TestBenchmark(object):
     def test_case1(self, benchmark):
         ret = benchmark(case1)
@@ -50,3 +164,53 @@ class TestBenchmark(object):
     def test_case4(self, benchmark):
         ret = benchmark(case4)
         assert ret
+
+
+@pytest.mark.benchmark(group="Corpus Tests")
+class TestCorpusBenchmark(object):
+    @staticmethod
+    def run(benchmark, corpus, caplog):
+        if benchmark.disabled:
+            pytest.skip("Corpus is already guessed by yml tests")
+        caplog.setLevel(logging.WARNING)  # Debug logs of rebulk would be captured, and slow down guesses
+        warmup()
+        durations = []
+        benchmark.pedantic(guess_corpus, args=(corpus, durations), rounds=3)
+        benchmark.extra_info.update(corpus_stats(durations))
+        assert durations
+
+    @pytest.mark.parametrize('filename', corpus_files, ids=corpus_ids)
+    def test_file(self, benchmark, caplog, filename):
+        self.run(benchmark, load_corpus(filename), caplog)
+
+    def test_all(self, benchmark, caplog):
+        corpus = []
+        for filename in corpus_files:
+            corpus.extend(load_corpus(filename))
+        self.run(benchmark, corpus, caplog)
+
+
+@pytest.mark.benchmark(group="Date Tests")
+class TestDateBenchmark(object):
+    def test_search_date(self, benchmark):
+        ret = benchmark(search_dates, load_corpus('rules/date.yml'))
+        assert any(ret)
+
+
+@pytest.mark.benchmark(
+    group="Cold Start Tests",
+    min_rounds=5,
+    warmup=False
+)
+class TestColdStartBenchmark(object):
+    def test_import(self, benchmark):
+        ret = benchmark(cold_import)
+        assert ret == 0
+
+    def test_first_guess(self, benchmark):
+        ret = benchmark(cold_start)
+        assert ret == 0
+
+    def test_rebulk_builder(self, benchmark):
+        ret = benchmark(cold_rebulk_builder)
+        assert ret
@@ -0,0 +1,65 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# pylint: disable=no-self-use, pointless-statement, missing-docstring, invalid-name
+
+import pytest
+
+from ..cache import LRUCache, InternTable, hashable
+
+
+def test_lru_eviction():
+    cache = LRUCache(maxsize=2)
+    cache.set('a', 1)
+    cache.set('b', 2)
+    assert cache.get('a') == 1
+    cache.set('c', 3)
+
+    assert 'a' in cache
+    assert 'b' not in cache
+    assert 'c' in cache
+    assert cache.stats == {'hits': 1, 'misses': 0, 'evictions': 1, 'size': 2}
+
+
+def test_lru_ttl():
+    now = [0]
+    cache = LRUCache(maxsize=2, ttl=10, timer=lambda: now[0])
+    cache.set('a', 1)
+    now[0] = 5
+    assert cache.get('a') == 1
+    now[0] = 10
+    assert cache.get('a') is None
+    assert cache.stats == {'hits': 1, 'misses': 1, 'evictions': 1, 'size': 0}
+
+
+def test_lru_clear():
+    cache = LRUCache()
+    cache.set('a', 1)
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.get('a', 'default') == 'default'
+
+
+def test_lru_invalid_maxsize():
+    with pytest.raises(ValueError):
+        LRUCache(maxsize=0)
+
+
+def test_hashable():
+    assert hashable({'b': [1, 2], 'a': {'c': set([3])}}) == hashable({'a': {'c': set([3])}, 'b': [1, 2]})
+    assert hash(hashable({'b': [1, 2], 'a': {'c': set([3])}}))
+
+    with pytest.raises(TypeError):
+        hashable({'a': bytearray(b'unhashable')})
+
+
+def test_intern_table():
+    table = InternTable(lambda *args: list(args), maxsize=2)
+    assert table('a', 1) is table('a', 1)
+    assert table('b') is table('b')
+    assert len(table) == 2
+
+    assert table('c') == ['c']
+    assert table('c') is not table('c')
+
+    table.clear()
+    assert len(table) == 0
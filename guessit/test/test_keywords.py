@@ -0,0 +1,36 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# pylint: disable=no-self-use, pointless-statement, missing-docstring, invalid-name
+from rebulk import Rebulk
+from rebulk.pattern import StringPattern
+
+from ..rules.common.keywords import KeywordIndex, KeywordPattern, index_keywords
+
+
+def test_keyword_pattern_same_matches():
+    strings = ['aaaa', 'AaAa.aAa', 'DD5.1.DDP.dd', 'DTS-HD.DTS.HD.dts-hdma', '']
+    keywords = [('a',), ('aa', 'aAa'), ('DD', 'DD5'), ('DTS', 'DTS-HD', 'HD')]
+    index = KeywordIndex()
+    for ignore_case in (False, True):
+        for patterns in keywords:
+            expected = StringPattern(*patterns, ignore_case=ignore_case)
+            actual = KeywordPattern(index, *patterns, ignore_case=ignore_case)
+            for string in strings:
+                assert [match.span for match in actual.matches(string)] == \
+                    [match.span for match in expected.matches(string)]
+
+
+def build_rebulk():
+    child = Rebulk().string('DTS', 'DTS-HD', name='audio_codec', ignore_case=True).regex('x26[45]', name='video_codec')
+    return Rebulk().string('HD', name='other', conflict_solver=lambda match, other: None).rebulk(child)
+
+
+def test_index_keywords():
+    rebulk = build_rebulk()
+    index = index_keywords(rebulk)
+
+    assert index.positions('dts-hd', 'HD') == ()
+    assert index.positions('dts-hd', 'DTS-HD', ignore_case=True) == (0,)
+    for string in ('DTS-HD.x264', 'dts.HD.DTS-HD'):
+        assert rebulk.matches(string).to_dict(details=True) == build_rebulk().matches(string).to_dict(details=True)
+    assert rebulk.matches('DTS-HD.x264').named('other')
@@ -2,9 +2,12 @@
 # -*- coding: utf-8 -*-
 # pylint: disable=no-self-use, pointless-statement, missing-docstring, invalid-name
 
+import io
+import json
 import os
 
 import pytest
+import six
 
 from ..__main__ import main
 
@@ -43,6 +46,17 @@ def test_main_show_property():
     main(['Fear.and.Loathing.in.Las.Vegas.FRENCH.ENGLISH.720p.HDDVD.DTS.x264-ESiR.mkv', '-P', 'title'])
 
 
+def test_main_only_property():
+    main(['Fear.and.Loathing.in.Las.Vegas.FRENCH.ENGLISH.720p.HDDVD.DTS.x264-ESiR.mkv', '--only-property', 'title',
+          '--only-property', 'year', '-j'])
+
+
+def test_main_only_property_show_property(capsys):
+    main(['Fear.and.Loathing.in.Las.Vegas.mkv', '--only-property', 'year', '-P', 'title'])
+    out, _ = capsys.readouterr()
+    assert out == 'Fear and Loathing in Las Vegas\n'
+
+
 def test_main_advanced():
     main(['Fear.and.Loathing.in.Las.Vegas.FRENCH.ENGLISH.720p.HDDVD.DTS.x264-ESiR.mkv', '-a'])
 
@@ -70,3 +84,40 @@ def test_main_help():
 
 def test_main_version():
     main(['--version'])
+
+
+def test_main_jobs():
+    main(['--input', os.path.join(__location__, 'test-input-file.txt'), '--jobs', '2'])
+
+
+def test_main_jobs_negative():
+    with pytest.raises(SystemExit):
+        main(['--jobs', '-1', 'Fear.and.Loathing.in.Las.Vegas.mkv'])
+
+
+def test_main_input_stdin(monkeypatch, capsys):
+    monkeypatch.setattr('sys.stdin', six.StringIO(u'# Comment\n\nFear.and.Loathing.in.Las.Vegas.mkv\n'))
+    main(['-f', '-', '--skip-comments', '-P', 'title'])
+    out, _ = capsys.readouterr()
+    assert out == 'Fear and Loathing in Las Vegas\n'
+
+
+@pytest.mark.skipif(six.PY2, reason="python 2 reads filenames as bytes")
+def test_main_input_stdin_utf8(monkeypatch, capsys):
+    stdin = io.TextIOWrapper(io.BytesIO(u'Amélie.2001.mkv\n'.encode('utf-8')), encoding='ascii')
+    monkeypatch.setattr('sys.stdin', stdin)
+    main(['-f', '-', '-P', 'title'])
+    out, _ = capsys.readouterr()
+    assert out == u'Amélie\n'
+    assert not stdin.buffer.closed
+
+
+def test_main_jsonl(capsys):
+    main(['Fear.and.Loathing.in.Las.Vegas.mkv', 'Treme.1x03.Right.Place,.Wrong.Time.HDTV.XviD-NoTV.avi', '--jsonl'])
+    out, _ = capsys.readouterr()
+    lines = out.splitlines()
+    assert len(lines) == 2
+    assert json.loads(lines[0])['input'] == 'Fear.and.Loathing.in.Las.Vegas.mkv'
+    assert json.loads(lines[0])['title'] == 'Fear and Loathing in Las Vegas'
+    assert json.loads(lines[1])['episode'] == 3
+    assert ' ' not in lines[0].replace('Fear and Loathing in Las Vegas', '')
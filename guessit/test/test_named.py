@@ -0,0 +1,58 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# pylint: disable=no-self-use, pointless-statement, missing-docstring, invalid-name
+import random
+
+import six
+from rebulk.match import Match, Matches
+
+from ..rules.common.named import range_named, range_tagged, previous_named, next_named, at_match_named
+
+
+def build_matches(seed):
+    rand = random.Random(seed)
+    input_string = 'x' * 40
+    matches = Matches(input_string=input_string)
+    for _ in range(30):
+        start = rand.randint(0, 38)
+        end = rand.randint(start + 1, min(start + 6, 40))
+        name = rand.choice(['a', 'b', 'c'])
+        tags = rand.sample(['x', 'y'], rand.randint(0, 2))
+        matches.append(Match(start, end, name=name, tags=tags, input_string=input_string))
+        matches.markers.append(Match(start, end, name=name, marker=True, input_string=input_string))
+    for match in rand.sample(list(matches), 5):
+        matches.remove(match)
+    return matches
+
+
+def test_named_queries_same_results():
+    for seed in range(20):
+        matches = build_matches(seed)
+        for names in ('a', 'd', ['a', 'b']):
+            name_list = [names] if isinstance(names, six.string_types) else names
+            predicate = lambda match, name_list=name_list: match.name in name_list
+            for index in (None, 0, -1):
+                for start, end in ((0, None), (5, 20), (12, 13)):
+                    assert range_named(matches, start, end, names, index) == \
+                        matches.range(start, end, predicate, index)
+                for match in list(matches) + list(matches.markers):
+                    assert previous_named(matches, match, names, index) == matches.previous(match, predicate, index)
+                    assert next_named(matches, match, names, index) == matches.next(match, predicate, index)
+                    assert at_match_named(matches.markers, match, names, index) == \
+                        matches.markers.at_match(match, predicate, index)
+        for tag in ('x', 'z'):
+            assert range_tagged(matches, 5, 20, tag) == matches.range(5, 20, lambda match, tag=tag: tag in match.tags)
+
+
+def test_named_queries_do_not_register_names():
+    matches = build_matches(0)
+    names = list(matches.names)
+    tags = list(matches.tags)
+
+    assert range_named(matches, 0, None, 'd') == []
+    assert previous_named(matches, matches[-1], 'd', 0) is None
+    assert next_named(matches, matches[0], 'd', 0) is None
+    assert range_tagged(matches, 0, None, 'z') == []
+
+    assert list(matches.names) == names
+    assert list(matches.tags) == tags
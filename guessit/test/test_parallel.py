@@ -0,0 +1,80 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# pylint: disable=no-self-use, pointless-statement, missing-docstring, invalid-name
+import multiprocessing
+import pickle
+import time
+
+import pytest
+
+from ..api import guessit, GuessitException, default_api
+from ..parallel import GuessItPool, guessit_many, _portable_result, _restore_result
+
+
+def test_guessit_many():
+    strings = ['Fear.and.Loathing.in.Las.Vegas.FRENCH.ENGLISH.720p.HDDVD.DTS.x264-ESiR.mkv',
+               'Treme.1x03.Right.Place,.Wrong.Time.HDTV.XviD-NoTV.avi',
+               None,
+               'Movies/Fantastic Mr Fox/Fantastic.Mr.Fox.2009.DVDRip.{x264+LC-AAC.5.1}{Fr-Eng}{Sub.Fr-Eng}.mkv']
+    results = list(guessit_many(strings, '-a', processes=2, chunksize=1))
+    assert [string for string, _ in results] == strings
+    assert isinstance(results[2][1], GuessitException)
+    for string, result in results[:2] + results[3:]:
+        assert result == guessit(string, '-a')
+
+
+def test_guessit_many_unordered():
+    strings = ['Show.Name.S01E%02d.720p.HDTV.x264-GRP.mkv' % i for i in range(1, 21)]
+    with GuessItPool(processes=2, chunksize=3) as pool:
+        results = list(pool.guessit_many(strings, ordered=False))
+    assert sorted(string for string, _ in results) == strings
+    for string, result in results:
+        assert result['episode'] == int(string[14:16])
+
+
+def test_exception_pickle():
+    try:
+        raise ValueError('error')
+    except ValueError:
+        exception = GuessitException('string', {'type': 'episode'})
+    restored = pickle.loads(pickle.dumps(exception))
+    assert str(restored) == str(exception)
+    assert restored.string == 'string'
+    assert restored.options == {'type': 'episode'}
+
+
+def test_portable_result_pickle():
+    string = 'Fear.and.Loathing.in.Las.Vegas.FRENCH.ENGLISH.720p.HDDVD.DTS.x264-ESiR.mkv'
+    result = default_api.guessit(string, '-a')
+    restored = _restore_result(pickle.loads(pickle.dumps(_portable_result(result), pickle.HIGHEST_PROTOCOL)))
+    assert restored == result
+    assert list(restored.keys()) == list(result.keys())
+    assert sorted(restored.matches.keys()) == sorted(result.matches.keys())
+    assert restored.values_list == result.values_list
+    for name, matches in result.matches.items():
+        assert [match.span for match in restored.matches[name]] == [match.span for match in matches]
+    for name, value in restored.items():
+        for match in value if isinstance(value, list) else [value]:
+            assert match.pattern is None
+            assert match in restored.matches[name]
+
+
+def test_pool_started_lazily():
+    with GuessItPool(processes=2) as pool:
+        assert list(pool.guessit_many([])) == []
+        assert pool._pool is None  # pylint:disable=protected-access
+
+
+def sleeping_worker(strings, options):  # pylint:disable=unused-argument
+    time.sleep(10)
+
+
+def test_timeout(monkeypatch):
+    monkeypatch.setattr('guessit.parallel._guess_chunk', sleeping_worker)
+    for ordered in (True, False):
+        pool = GuessItPool(processes=1, timeout=0.1)
+        try:
+            with pytest.raises(multiprocessing.TimeoutError):
+                list(pool.guessit_many(['Movie.2010.mkv'], ordered=ordered))
+        finally:
+            pool.terminate()
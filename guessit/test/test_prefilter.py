@@ -0,0 +1,36 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# pylint: disable=no-self-use, pointless-statement, missing-docstring, invalid-name
+import re
+
+from rebulk import Rebulk
+
+from ..rules.common.prefilter import PrefilteredRePattern, mergeable, prefilter_regexes
+
+
+def build_rebulk():
+    return Rebulk().regex_defaults(flags=re.IGNORECASE) \
+        .regex(r'(?P<codec>DTS)-?HD', r'DTS', name='audio_codec') \
+        .regex(r'(\w)\1', name='twice') \
+        .regex(r'DD5\.?1', name='audio_codec', value='DD5.1', tags=['dolby'])
+
+
+def test_prefilter_regexes():
+    rebulk = build_rebulk()
+    prefilters = prefilter_regexes(rebulk)
+
+    assert len(prefilters) == 1
+    patterns = rebulk._patterns  # pylint:disable=protected-access
+    assert [isinstance(pattern, PrefilteredRePattern) for pattern in patterns] == [True, False, True]
+
+    for string in ('Movie.DTS-HD.dd5.1.mkv', 'Movie.dts.mkv', 'Movie.mkv', 'Movie.AC3.mkv'):
+        assert rebulk.matches(string).to_dict(details=True) == build_rebulk().matches(string).to_dict(details=True)
+
+
+def test_mergeable():
+    assert mergeable(re.compile(u'(?P<codec>DTS)-?HD'))
+    assert not mergeable(re.compile(u'(\\w)\\1'))
+    assert not mergeable(re.compile(u'(?P<x>\\w)(?P=x)'))
+    assert not mergeable(re.compile(u'(?i)DTS'))
+    assert not mergeable(re.compile(u'(<)?DTS(?(1)>)'))
+    assert not mergeable(re.compile(u'(?P<open><)?DTS(?(open)>)'))
@@ -0,0 +1,35 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# pylint: disable=no-self-use, pointless-statement, missing-docstring, invalid-name, protected-access
+
+from ..api import GuessItApi
+from ..profiling import Profiler
+from ..rules import rebulk_builder
+
+
+def test_profiler():
+    api = GuessItApi(rebulk_builder())
+    expected = api.guessit('Treme.1x03.Right.Place,.Wrong.Time.HDTV.XviD-NoTV.avi')
+
+    with Profiler(api) as profiler:
+        assert api.guessit('Treme.1x03.Right.Place,.Wrong.Time.HDTV.XviD-NoTV.avi') == expected
+        api.guessit('Fear.and.Loathing.in.Las.Vegas.FRENCH.ENGLISH.720p.HDDVD.DTS.x264-ESiR.mkv')
+
+    report = profiler.report()
+    rows = dict(((row['builder'], row['name']), row) for row in report)
+    assert rows[('episodes', 'patterns')]['calls'] > 0
+    assert rows[('title', 'TitleFromPosition.when')]['calls'] == 2
+    assert rows[('type', 'TypeProcessor.then')]['calls'] == 2
+    assert [row['time'] for row in report] == sorted([row['time'] for row in report], reverse=True)
+
+    for child in api.rebulk._rebulks:
+        for pattern in child._patterns:
+            assert 'matches' not in pattern.__dict__
+        for rule in child._rules:
+            assert 'when' not in rule.__dict__ and 'then' not in rule.__dict__
+
+    api.guessit('Treme.1x03.Right.Place,.Wrong.Time.HDTV.XviD-NoTV.avi')
+    assert profiler.report() == report
+
+    profiler.reset()
+    assert profiler.report() == []